@@ -8,14 +8,122 @@ from meetings within a date range, organized by day into separate text files.
 import argparse
 import os
 import sys
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from operator import attrgetter
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 from ...core.parser import GranolaParser
-from ...core.meeting import Meeting
+from ...core.meeting import Meeting, get_meeting_start_time_utc
+from ...core.timezone_utils import get_cst_timezone
 from ...core.transcript import Transcript, TranscriptSegment
 from ..formatters.colors import print_error, print_info, print_success
 from ...utils.date_parser import get_date_range, parse_date
 
+# Buffer size for streaming daily files (fewer write syscalls on large days)
+WRITE_BUFFER_SIZE = 1 << 19
+
+
+def _has_min_words(text: str, min_words: int) -> bool:
+    """
+    Check whether text contains at least min_words whitespace-separated words.
+
+    Splitting with maxsplit stops after min_words words, so long segments are
+    not broken into a full word list just to compare its length.
+
+    Args:
+        text: Text to check
+        min_words: Minimum number of words required
+
+    Returns:
+        bool: True if text has at least min_words words
+    """
+    if min_words <= 0:
+        return True
+    return len(text.split(None, min_words - 1)) >= min_words
+
+
+class _DailyFileWriter:
+    """
+    Stream meeting lines into a daily file as UTF-8 bytes.
+
+    The file content equals joining each meeting's lines with newlines,
+    skipping meetings with no text, separating the rest with a blank line
+    and stripping the whole result. Leading whitespace is dropped and
+    whitespace after the last text is held back until more text follows,
+    so nothing has to be joined in memory. The file is only created once
+    there is text to write.
+    """
+
+    def __init__(self, filepath: str):
+        """
+        Initialize the writer.
+
+        Args:
+            filepath: Path of the daily file
+        """
+        self.filepath = filepath
+        self.word_count = 0
+        self._file: Optional[BinaryIO] = None
+        self._pending = ""
+
+    @property
+    def created(self) -> bool:
+        """Whether any text was written, creating the file."""
+        return self._file is not None
+
+    def __enter__(self) -> '_DailyFileWriter':
+        """Enter the writer context."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the file if one was created."""
+        if self._file is not None:
+            self._file.close()
+
+    def _append(self, fragment: str) -> None:
+        """
+        Append a fragment of file text, holding back trailing whitespace.
+
+        Args:
+            fragment: Text to append
+        """
+        text = fragment.rstrip()
+        if not text:
+            # Whitespace is only written if more text follows it
+            if self._file is not None:
+                self._pending += fragment
+            return
+
+        trailing = fragment[len(text):]
+        if self._file is None:
+            text = text.lstrip()
+            self._file = open(self.filepath, 'wb', buffering=WRITE_BUFFER_SIZE)
+
+        self._file.write((self._pending + text).encode('utf-8'))
+        self._pending = trailing
+        self.word_count += len(text.split())
+
+    def write_meeting(self, lines: Iterable[str]) -> None:
+        """
+        Write one meeting's lines, skipping the meeting if it has no text.
+
+        Args:
+            lines: Lines of the meeting (without trailing newlines)
+        """
+        # Whitespace-only lines at the start of the meeting, kept until the
+        # meeting turns out to have text
+        leading: Optional[List[str]] = []
+        for line in lines:
+            if leading is None:
+                self._append('\n' + line)
+            elif line.strip():
+                leading.append(line)
+                separator = '\n\n' if self._file is not None else ''
+                self._append(separator + '\n'.join(leading))
+                leading = None
+            else:
+                leading.append(line)
+
 
 class CollectCommand:
     """Command to collect your own words from meetings over a date range."""
@@ -125,30 +233,48 @@ class CollectCommand:
         Returns:
             List of segments that are from microphone source
         """
-        my_segments = []
-        
-        for segment in transcript.segments:
-            # Check if this segment is from microphone (my words)
-            if hasattr(segment, '_data') and segment._data.get('source') == 'microphone':
-                # Filter by minimum words if specified
-                if len(segment.text.split()) >= self.args.min_words:
-                    my_segments.append(segment)
-        
-        return my_segments
-
-    def _group_segments_by_date(self, meetings: List[Meeting]) -> Dict[str, List[Tuple[Meeting, List[TranscriptSegment]]]]:
+        segments = transcript.segments
+        # All segments share a type, so checking for raw data once is enough
+        if not segments or not hasattr(segments[0], '_data'):
+            return []
+
+        min_words = self.args.min_words
+
+        # Keep microphone segments (my words) that meet the minimum word count
+        return [
+            segment for segment in segments
+            if segment._data.get('source') == 'microphone'
+            and _has_min_words(segment.text, min_words)
+        ]
+
+    def _group_segments_by_date(self, start_date: datetime,
+                                end_date: datetime) -> Tuple[int, Dict[str, List[Tuple[Meeting, List[TranscriptSegment]]]]]:
         """
-        Group transcript segments by date.
+        Group transcript segments by date for meetings in a date range.
+
+        Filtering and grouping happen in one pass over the cache, so only
+        meetings that contribute segments stay referenced afterwards.
 
         Args:
-            meetings: List of meetings to process
+            start_date: Start of the date range
+            end_date: End of the date range
 
         Returns:
-            Dictionary mapping date strings (YYYY-MM-DD) to list of (meeting, segments) tuples
+            Tuple of (number of meetings in range, dictionary mapping date
+            strings (YYYY-MM-DD) to list of (meeting, segments) tuples)
         """
-        date_groups = {}
-        
-        for meeting in meetings:
+        cst_tz = get_cst_timezone()
+        date_groups = defaultdict(list)
+        meeting_count = 0
+
+        for meeting_data in self.parser.get_meetings():
+            # Check the raw start time before wrapping the record in a Meeting
+            meeting_start = get_meeting_start_time_utc(meeting_data)
+            if meeting_start is None or not start_date <= meeting_start <= end_date:
+                continue
+            meeting_count += 1
+
+            meeting = Meeting(meeting_data)
             transcript = meeting.transcript
             if not transcript:
                 continue
@@ -158,65 +284,72 @@ class CollectCommand:
             if not my_segments:
                 continue
                 
-            # Group by date based on meeting start time
-            meeting_start_time = meeting.start_time
-            if meeting_start_time:
-                date_str = meeting_start_time.strftime('%Y-%m-%d')
-                if date_str not in date_groups:
-                    date_groups[date_str] = []
-                date_groups[date_str].append((meeting, my_segments))
+            # Group by date based on meeting start time in CST
+            local_start = meeting_start.astimezone(cst_tz)
+            date_str = f"{local_start.year:04d}-{local_start.month:02d}-{local_start.day:02d}"
+            date_groups[date_str].append((meeting, my_segments))
         
-        return date_groups
+        return meeting_count, dict(date_groups)
 
-    def _format_segments_for_file(self, meeting: Meeting, segments: List[TranscriptSegment]) -> str:
+    def _iter_segment_lines(self, meeting: Meeting, segments: List[TranscriptSegment]) -> Iterator[str]:
         """
-        Format segments for writing to a file.
+        Yield the lines written to a daily file for one meeting.
 
         Args:
             meeting: Meeting the segments belong to
             segments: List of segments to format
 
-        Returns:
-            Formatted string for file output
+        Yields:
+            str: Formatted lines (without trailing newlines)
         """
-        lines = []
-        
         # Add meeting info if requested
         if self.args.include_meeting_info:
-            lines.append(f"# Meeting: {meeting.title or 'Untitled Meeting'}")
+            yield f"# Meeting: {meeting.title or 'Untitled Meeting'}"
             if meeting.start_time:
-                lines.append(f"# Date: {meeting.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            lines.append("")
-        
-        # Add segments
-        for segment in segments:
-            if self.args.include_timestamps and segment.timestamp:
-                timestamp_str = segment.timestamp.strftime('%H:%M:%S')
-                lines.append(f"[{timestamp_str}] {segment.text}")
-            else:
-                lines.append(segment.text)
-        
-        return '\n'.join(lines)
-
-    def _write_daily_file(self, date_str: str, content: str) -> None:
+                yield f"# Date: {meeting.start_time.strftime('%Y-%m-%d %H:%M:%S')}"
+            yield ""
+
+        # Add segments, choosing the line format once instead of per segment
+        if self.args.include_timestamps:
+            def format_segment(segment: TranscriptSegment) -> str:
+                timestamp = segment.timestamp
+                if timestamp:
+                    return f"[{timestamp.strftime('%H:%M:%S')}] {segment.text}"
+                return segment.text
+        else:
+            format_segment = attrgetter('text')
+
+        yield from map(format_segment, segments)
+
+    def _write_daily_file(self, date_str: str,
+                          meeting_segments: List[Tuple[Meeting, List[TranscriptSegment]]]) -> int:
         """
-        Write content to a daily file.
+        Stream all meetings for a day into its daily file.
 
         Args:
             date_str: Date string (YYYY-MM-DD)
-            content: Content to write
+            meeting_segments: List of (meeting, segments) tuples for the day
+
+        Returns:
+            int: Number of words written (0 if the day had no text, in
+            which case no file is created)
         """
         filename = f"{date_str}.txt"
         filepath = os.path.join(self.args.output_dir, filename)
-        
+
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            word_count = len(content.split())
+            with _DailyFileWriter(filepath) as writer:
+                for meeting, segments in meeting_segments:
+                    writer.write_meeting(self._iter_segment_lines(meeting, segments))
+
+            if not writer.created:
+                return 0
+
             if self.args.verbose:
-                print_info(f"Created {filename} ({word_count} words)")
-        
+                print_info(f"Created {filename} ({writer.word_count} words)")
+
+            return writer.word_count
+
         except Exception as e:
             print_error(f"Error writing {filename}: {e}")
             raise
@@ -240,22 +373,15 @@ class CollectCommand:
             # Create output directory
             os.makedirs(self.args.output_dir, exist_ok=True)
 
-            # Get meetings in date range
-            meetings = []
-            for meeting_data in self.parser.get_meetings():
-                meeting = Meeting(meeting_data)
-                if meeting.start_time and start_date <= meeting.start_time <= end_date:
-                    meetings.append(meeting)
+            # Get meetings in date range and group their segments by date
+            meeting_count, date_groups = self._group_segments_by_date(start_date, end_date)
 
-            if not meetings:
+            if not meeting_count:
                 print_info("No meetings found in the specified date range")
                 return 0
 
             if self.args.verbose:
-                print_info(f"Found {len(meetings)} meetings")
-
-            # Group segments by date
-            date_groups = self._group_segments_by_date(meetings)
+                print_info(f"Found {meeting_count} meetings")
 
             if not date_groups:
                 print_info("No words found from microphone source in the specified date range")
@@ -264,20 +390,7 @@ class CollectCommand:
             # Write daily files
             total_words = 0
             for date_str in sorted(date_groups.keys()):
-                meeting_segments = date_groups[date_str]
-                
-                # Combine all segments for this date
-                all_content = []
-                for meeting, segments in meeting_segments:
-                    content = self._format_segments_for_file(meeting, segments)
-                    if content.strip():
-                        all_content.append(content)
-                        all_content.append("")  # Add blank line between meetings
-                
-                if all_content:
-                    daily_content = '\n'.join(all_content).strip()
-                    self._write_daily_file(date_str, daily_content)
-                    total_words += len(daily_content.split())
+                total_words += self._write_daily_file(date_str, date_groups[date_str])
 
             print_success(f"Collected {total_words} words across {len(date_groups)} days")
             print_info(f"Files saved to: {self.args.output_dir}")
@@ -13,6 +13,9 @@ from ...core.meeting import Meeting
 from ..formatters.colors import print_error, print_info
 from ..formatters.markdown import export_meeting_to_markdown
 
+# Buffer size for writing exported files
+WRITE_BUFFER_SIZE = 1 << 17
+
 
 class ExportCommand:
     """Command to export meeting data to markdown."""
@@ -119,11 +122,9 @@ class ExportCommand:
             return Meeting(meeting_data)
 
         # Try partial ID match
-        all_meetings = self.parser.get_meetings()
-        for data in all_meetings:
-            meeting = Meeting(data)
-            if meeting.id and meeting.id.startswith(meeting_id):
-                return meeting
+        meeting_data = self.parser.find_meeting_by_id_prefix(meeting_id)
+        if meeting_data:
+            return Meeting(meeting_data)
 
         return None
 
@@ -137,22 +138,22 @@ class ExportCommand:
         Returns:
             str: Markdown content
         """
+        args = self.args
+
         # Override title if specified
-        if self.args.title:
-            # Create a copy of the meeting data with custom title
-            meeting_data = meeting.raw_data.copy()
-            meeting_data['title'] = self.args.title
-            meeting = Meeting(meeting_data)
+        if args.title:
+            # Layer the custom title over the meeting data instead of copying it
+            meeting = meeting.with_overrides(title=args.title)
 
         # Determine what to include
-        include_transcript = not self.args.no_transcript
-        include_metadata = not self.args.no_metadata
-        include_participants = not self.args.no_participants
-        include_summary = not self.args.no_summary
-        include_notes = not self.args.no_notes
-        include_tags = not self.args.no_tags
-        include_speakers = not self.args.no_speakers
-        include_timestamps = self.args.timestamps
+        include_transcript = not args.no_transcript
+        include_metadata = not args.no_metadata
+        include_participants = not args.no_participants
+        include_summary = not args.no_summary
+        include_notes = not args.no_notes
+        include_tags = not args.no_tags
+        include_speakers = not args.no_speakers
+        include_timestamps = args.timestamps
 
         return export_meeting_to_markdown(
             meeting,
@@ -175,16 +176,26 @@ class ExportCommand:
         """
         if self.args.output:
             try:
-                with open(self.args.output, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                # Encode once and write bytes directly, skipping the text layer
+                with open(self.args.output, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                    f.write(content.encode('utf-8'))
                 if self.args.verbose:
                     print_info(f"Exported to: {self.args.output}", file=sys.stderr)
             except Exception as e:
                 print_error(f"Error writing to file {self.args.output}: {e}")
                 raise
         else:
-            # Write to stdout
-            print(content)
+            # Write to stdout, flushing pending text first so earlier
+            # print() output stays ahead of the bytes written below
+            sys.stdout.flush()
+            buffer = getattr(sys.stdout, 'buffer', None)
+            if buffer is None:
+                # Text-only stdout (e.g. redirect_stdout to a StringIO)
+                sys.stdout.write(content + "\n")
+                return
+            buffer.write(content.encode('utf-8'))
+            buffer.write(b"\n")
+            buffer.flush()
 
     def execute(self) -> int:
         """
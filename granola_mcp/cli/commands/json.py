@@ -6,12 +6,21 @@ embedded in the Granola cache file.
 """
 
 import argparse
+import io
 import json
 import sys
-from typing import Optional
+from typing import Any, Optional
 from ...core.parser import GranolaParser
 from ..formatters.colors import print_error
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+# Buffer size used when streaming JSON to stdout
+OUTPUT_BUFFER_SIZE = 128 * 1024
+
 
 class JsonCommand:
     """Command to extract and pretty-print JSON data from cache."""
@@ -54,6 +63,94 @@ class JsonCommand:
             help='Sort JSON keys alphabetically'
         )
 
+    def _dumps_orjson(self, cache_data: Any) -> Optional[bytes]:
+        """
+        Serialize cache data with orjson when it can honor the requested format.
+
+        Args:
+            cache_data: Data to serialize
+
+        Returns:
+            Optional[bytes]: UTF-8 encoded JSON, or None to use the stdlib encoder
+        """
+        # orjson only supports a 2-space indent
+        if orjson is None or not (self.args.compact or self.args.indent == 2):
+            return None
+
+        option = 0
+        if not self.args.compact:
+            option |= orjson.OPT_INDENT_2
+        if self.args.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+
+        try:
+            return orjson.dumps(cache_data, option=option)
+        except orjson.JSONEncodeError:
+            return None
+
+    def _dump_json(self, cache_data: Any, stream: Any) -> None:
+        """
+        Encode cache data as JSON into a text stream with the stdlib encoder.
+
+        Args:
+            cache_data: Data to serialize
+            stream: Text stream to write to
+        """
+        # Determine JSON formatting options
+        if self.args.compact:
+            indent = None
+            separators = (',', ':')
+        else:
+            indent = self.args.indent
+            separators = (',', ': ')
+
+        json.dump(
+            cache_data,
+            stream,
+            indent=indent,
+            separators=separators,
+            sort_keys=self.args.sort_keys,
+            ensure_ascii=False
+        )
+        stream.write("\n")
+
+    def _write_json(self, cache_data: Any) -> None:
+        """
+        Stream cache data as JSON to stdout through a large write buffer.
+
+        Args:
+            cache_data: Data to serialize
+        """
+        json_bytes = self._dumps_orjson(cache_data)
+
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is None:
+            # stdout replaced by a text-only stream (e.g. redirect_stdout to
+            # a StringIO), so write text to it directly
+            if json_bytes is not None:
+                sys.stdout.write(json_bytes.decode('utf-8') + "\n")
+            else:
+                self._dump_json(cache_data, sys.stdout)
+            return
+
+        sys.stdout.flush()
+        writer = io.BufferedWriter(buffer, buffer_size=OUTPUT_BUFFER_SIZE)
+        try:
+            if json_bytes is not None:
+                writer.write(json_bytes)
+                writer.write(b"\n")
+                return
+
+            # Encode incrementally instead of building the whole document in memory
+            stream = io.TextIOWrapper(writer, encoding='utf-8', write_through=False)
+            try:
+                self._dump_json(cache_data, stream)
+            finally:
+                stream.detach()
+        finally:
+            writer.flush()
+            writer.detach()
+
     def execute(self) -> int:
         """
         Execute the JSON command.
@@ -65,25 +162,8 @@ class JsonCommand:
             # Load the inner cache data (already parsed from the embedded JSON string)
             cache_data = self.parser.load_cache()
 
-            # Determine JSON formatting options
-            if self.args.compact:
-                indent = None
-                separators = (',', ':')
-            else:
-                indent = self.args.indent
-                separators = (',', ': ')
-
-            # Pretty print the JSON data
-            json_output = json.dumps(
-                cache_data,
-                indent=indent,
-                separators=separators,
-                sort_keys=self.args.sort_keys,
-                ensure_ascii=False
-            )
-
             # Output to stdout (can be piped)
-            print(json_output)
+            self._write_json(cache_data)
 
             return 0
 
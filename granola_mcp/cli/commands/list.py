@@ -7,9 +7,11 @@ including date ranges, title search, and participant filtering.
 
 import argparse
 import datetime
-from typing import List, Optional, Dict, Any
+import heapq
+import sys
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from ...core.parser import GranolaParser
-from ...core.meeting import Meeting
+from ...core.meeting import Meeting, get_meeting_id, get_meeting_start_time_utc, get_meeting_title
 from ...utils.date_parser import parse_date, get_date_range
 from ..formatters.colors import (
     Colors, colorize, format_duration,
@@ -18,6 +20,71 @@ from ..formatters.colors import (
 from ..formatters.table import Table, TableAlignment
 
 
+def _title_sort_key(meeting: Meeting) -> str:
+    """Sort key for ordering meetings by title."""
+    return meeting.title or ""
+
+
+def _duration_sort_key(meeting: Meeting) -> float:
+    """Sort key for ordering meetings by duration in seconds."""
+    duration = meeting.duration
+    return duration.total_seconds() if duration else 0
+
+
+def _participants_sort_key(meeting: Meeting) -> int:
+    """Sort key for ordering meetings by participant count."""
+    return len(meeting.participants)
+
+
+def _date_sort_key(meeting: Meeting) -> float:
+    """Sort key for ordering meetings by start time (epoch seconds)."""
+    start_time = meeting.start_time
+    return start_time.timestamp() if start_time else float('-inf')
+
+
+def _record_title_sort_key(meeting_data: Dict[str, Any]) -> str:
+    """Sort key for ordering raw meeting records by title."""
+    return get_meeting_title(meeting_data) or ""
+
+
+def _record_date_sort_key(meeting_data: Dict[str, Any]) -> float:
+    """Sort key for ordering raw meeting records by start time (epoch seconds)."""
+    start_time = get_meeting_start_time_utc(meeting_data)
+    return start_time.timestamp() if start_time else float('-inf')
+
+
+# Sort keys that work on raw meeting records, for output that needs no Meeting
+RECORD_SORT_KEYS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    'date': _record_date_sort_key,
+    'title': _record_title_sort_key,
+}
+
+
+def _truncate(text: str, max_length: int) -> str:
+    """
+    Shorten text to max_length characters, ending in "..." when cut.
+
+    Args:
+        text: Text to shorten
+        max_length: Maximum length of the result
+
+    Returns:
+        str: The original text if it fits, otherwise the shortened text
+    """
+    if len(text) <= max_length:
+        return text
+    return text[:max_length - 3] + "..."
+
+
+# Sort key function for each --sort-by choice
+SORT_KEYS: Dict[str, Callable[[Meeting], Any]] = {
+    'date': _date_sort_key,
+    'title': _title_sort_key,
+    'duration': _duration_sort_key,
+    'participants': _participants_sort_key,
+}
+
+
 class ListCommand:
     """Command to list meetings with filtering options."""
 
@@ -32,6 +99,19 @@ class ListCommand:
         self.parser = parser
         self.args = args
 
+        # Case-folded search terms, normalized once
+        self._folder_term = args.folder.casefold() if args.folder else None
+        self._title_term = args.title_contains.casefold() if args.title_contains else None
+        self._participant_term = args.participant.casefold() if args.participant else None
+
+        # Date bounds, parsed once; an invalid date is reported on execute
+        self._date_bounds: Optional[Tuple[datetime.datetime, datetime.datetime]] = None
+        self._date_error: Optional[str] = None
+        try:
+            self._date_bounds = self._parse_date_bounds()
+        except ValueError as e:
+            self._date_error = str(e)
+
     @staticmethod
     def add_arguments(parser: argparse.ArgumentParser) -> None:
         """
@@ -84,7 +164,7 @@ class ListCommand:
         # Sorting options
         parser.add_argument(
             '--sort-by',
-            choices=['date', 'title', 'duration', 'participants'],
+            choices=list(SORT_KEYS),
             default='date',
             help='Sort meetings by field (default: date)'
         )
@@ -115,164 +195,145 @@ class ListCommand:
             help='Hide table header'
         )
 
-    def _filter_meetings_by_date(self, meetings: List[Meeting]) -> List[Meeting]:
+    def _parse_date_bounds(self) -> Optional[Tuple[datetime.datetime, datetime.datetime]]:
         """
-        Filter meetings by date criteria.
-
-        Args:
-            meetings: List of meetings to filter
+        Parse the date filter arguments into a (start, end) range.
 
         Returns:
-            List[Meeting]: Filtered meetings
-        """
-        if not self.args.last and not self.args.from_date:
-            return meetings
-
-        try:
-            if self.args.last:
-                # Filter by relative date
-                start_date = parse_date(self.args.last)
-                end_date = datetime.datetime.now(start_date.tzinfo)  # Use same timezone
-            else:
-                # Filter by date range
-                start_date, end_date = get_date_range(
-                    self.args.from_date,
-                    self.args.to_date
-                )
-
-            filtered_meetings = []
-            for meeting in meetings:
-                if meeting.start_time and start_date <= meeting.start_time <= end_date:
-                    filtered_meetings.append(meeting)
-
-            return filtered_meetings
+            Optional[Tuple[datetime.datetime, datetime.datetime]]: Date range,
+            or None if no date filter was given
 
-        except ValueError as e:
-            print_error(f"Invalid date format: {e}")
-            return []
-
-    def _filter_meetings_by_title(self, meetings: List[Meeting]) -> List[Meeting]:
+        Raises:
+            ValueError: If a date argument is invalid
         """
-        Filter meetings by title content.
+        args = self.args
+        if args.last:
+            # Filter by relative date
+            start_date = parse_date(args.last)
+            end_date = datetime.datetime.now(start_date.tzinfo)  # Use same timezone
+            return start_date, end_date
 
-        Args:
-            meetings: List of meetings to filter
+        if args.from_date:
+            # Filter by date range
+            return get_date_range(args.from_date, args.to_date)
 
-        Returns:
-            List[Meeting]: Filtered meetings
-        """
-        if not self.args.title_contains:
-            return meetings
-
-        search_term = self.args.title_contains.lower()
-        filtered_meetings = []
-
-        for meeting in meetings:
-            title = meeting.title or ""
-            if search_term in title.lower():
-                filtered_meetings.append(meeting)
-
-        return filtered_meetings
+        return None
 
-    def _filter_meetings_by_participant(self, meetings: List[Meeting]) -> List[Meeting]:
+    def _build_filters(self) -> Optional[Tuple[Optional[Callable[[Dict[str, Any]], bool]],
+                                               Optional[Callable[[Meeting], bool]]]]:
         """
-        Filter meetings by participant.
+        Build the predicates combining all active filters.
 
-        Args:
-            meetings: List of meetings to filter
+        Filter arguments are read and normalized once, and only the active
+        checks are included. Date, folder and title are checked on the raw
+        meeting data, cheapest first, so only matching records are wrapped in
+        Meeting objects; the participant check then runs on those meetings.
 
         Returns:
-            List[Meeting]: Filtered meetings
+            Optional[Tuple]: (raw data predicate, meeting predicate), either
+            None when it has no active checks, or None if the date criteria
+            are invalid
         """
-        if not self.args.participant:
-            return meetings
-
-        search_term = self.args.participant.lower()
-        filtered_meetings = []
-
-        for meeting in meetings:
-            participants = meeting.participants
-            for participant in participants:
-                if search_term in participant.lower():
-                    filtered_meetings.append(meeting)
-                    break
-
-        return filtered_meetings
-
-    def _filter_meetings_by_folder(self, meetings: List[Meeting]) -> List[Meeting]:
+        if self._date_error is not None:
+            print_error(f"Invalid date format: {self._date_error}")
+            return None
+
+        # Compare epoch seconds rather than timezone-aware datetimes
+        start_ts = end_ts = None
+        if self._date_bounds is not None:
+            start_ts = self._date_bounds[0].timestamp()
+            end_ts = self._date_bounds[1].timestamp()
+        folder_term = self._folder_term
+        title_term = self._title_term
+        participant_term = self._participant_term
+
+        # Nothing to build when no filter was given
+        if (start_ts is None and folder_term is None and title_term is None
+                and participant_term is None):
+            return None, None
+
+        # Titles and folder names repeat across recurring meetings, so each
+        # distinct string is case-folded only once
+        folded: Dict[str, str] = {}
+
+        def casefold(text: str) -> str:
+            result = folded.get(text)
+            if result is None:
+                result = folded[text] = text.casefold()
+            return result
+
+        def data_predicate(meeting_data: Dict[str, Any]) -> bool:
+            if start_ts is not None:
+                start_time = get_meeting_start_time_utc(meeting_data)
+                if start_time is None or not start_ts <= start_time.timestamp() <= end_ts:
+                    return False
+
+            # Search terms are never empty, so a missing value can't match
+            if folder_term is not None:
+                folder_name = meeting_data.get('folder_name')
+                if not folder_name or folder_term not in casefold(folder_name):
+                    return False
+
+            if title_term is not None:
+                title = get_meeting_title(meeting_data)
+                if not title or title_term not in casefold(title):
+                    return False
+
+            return True
+
+        if start_ts is None and folder_term is None and title_term is None:
+            data_predicate = None
+
+        meeting_predicate = None
+        if participant_term is not None:
+            def meeting_predicate(meeting: Meeting) -> bool:
+                # One case-folded haystack per meeting; the unit separator
+                # keeps matches from spanning two participants
+                participants = meeting.participants
+                return bool(participants) and participant_term in "\x1f".join(participants).casefold()
+
+        return data_predicate, meeting_predicate
+
+    def _sort_meetings(self, meetings: List[Any], limit: Optional[int] = None,
+                       key: Optional[Callable[[Any], Any]] = None) -> List[Any]:
         """
-        Filter meetings by folder/list name.
+        Sort meetings by specified criteria.
+
+        When a limit smaller than the number of meetings is given, only the
+        first `limit` meetings are selected with a heap instead of sorting
+        the whole list.
 
         Args:
-            meetings: List of meetings to filter
+            meetings: List of meetings (or raw records, with a matching key) to sort
+            limit: Maximum number of meetings to return (None for all)
+            key: Sort key function (defaults to the one for --sort-by)
 
         Returns:
-            List[Meeting]: Filtered meetings
+            List[Any]: Sorted meetings
         """
-        if not self.args.folder:
-            return meetings
-
-        search_term = self.args.folder.lower()
-        filtered_meetings = []
-
-        for meeting in meetings:
-            folder_name = meeting.folder_name or ""
-            if search_term in folder_name.lower():
-                filtered_meetings.append(meeting)
-
-        return filtered_meetings
+        # Choose the key function once rather than branching per meeting
+        if key is None:
+            key = SORT_KEYS.get(self.args.sort_by, _date_sort_key)
+        reverse = self.args.reverse
 
-    def _sort_meetings(self, meetings: List[Meeting]) -> List[Meeting]:
-        """
-        Sort meetings by specified criteria.
+        if limit and limit < len(meetings):
+            # Same ordering (and tie-breaking) as sorted(...)[:limit]
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            return select(limit, meetings, key=key)
 
-        Args:
-            meetings: List of meetings to sort
+        return sorted(meetings, key=key, reverse=reverse)
 
-        Returns:
-            List[Meeting]: Sorted meetings
-        """
-        def sort_key(meeting: Meeting):
-            if self.args.sort_by == 'title':
-                return meeting.title or ""
-            elif self.args.sort_by == 'duration':
-                duration = meeting.duration
-                return duration.total_seconds() if duration else 0
-            elif self.args.sort_by == 'participants':
-                return len(meeting.participants)
-            else:  # date
-                return meeting.start_time or datetime.datetime.min
-
-        return sorted(meetings, key=sort_key, reverse=self.args.reverse)
-
-    def _calculate_stats(self, meetings: List[Meeting]) -> Dict[str, Any]:
+    def _finalize_stats(self, stats: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Calculate statistics for the meetings.
+        Derive per-day statistics from the totals accumulated by the table rows.
 
         Args:
-            meetings: List of meetings to calculate stats for
+            stats: Statistics dictionary filled in by _iter_table_rows
 
         Returns:
             Dict[str, Any]: Statistics dictionary
         """
-        stats = {
-            'total_meetings': len(meetings),
-            'total_duration_seconds': 0,
-            'meetings_with_duration': 0,
-            'unique_dates': set()
-        }
-
-        for meeting in meetings:
-            if meeting.duration:
-                stats['total_duration_seconds'] += meeting.duration.total_seconds()
-                stats['meetings_with_duration'] += 1
-            
-            if meeting.start_time:
-                # Track unique dates (just the date part, not time)
-                date_only = meeting.start_time.date()
-                stats['unique_dates'].add(date_only)
-
-        stats['unique_days'] = len(stats['unique_dates'])
+        stats['unique_days'] = len(stats['unique_day_ordinals'])
         stats['avg_hours_per_day'] = 0
 
         if stats['unique_days'] > 0 and stats['total_duration_seconds'] > 0:
@@ -281,66 +342,71 @@ class ListCommand:
 
         return stats
 
-    def _format_table_output(self, meetings: List[Meeting]) -> None:
+    def _iter_table_rows(self, meetings: List[Meeting],
+                         stats: Dict[str, Any]) -> Iterator[List[str]]:
         """
-        Format meetings as a table.
+        Yield the table cells for each meeting.
+
+        Totals are accumulated in the same pass, since the rows already read
+        each meeting's duration and start time.
 
         Args:
             meetings: List of meetings to display
+            stats: Statistics dictionary updated in place
+
+        Yields:
+            List[str]: Cells for one table row
         """
-        if not meetings:
-            print_info("No meetings found matching the criteria.")
-            return
+        unique_day_ordinals = stats['unique_day_ordinals']
+        previous_ordinal = None
 
-        # Create table
-        headers = ['ID', 'Title', 'Date', 'Duration', 'Transcript', 'Summary', 'Notes', 'Folder']
-        alignments = [
-            TableAlignment.LEFT,
-            TableAlignment.LEFT,
-            TableAlignment.LEFT,
-            TableAlignment.RIGHT,
-            TableAlignment.RIGHT,
-            TableAlignment.RIGHT,
-            TableAlignment.RIGHT,
-            TableAlignment.LEFT
-        ]
+        for meeting in meetings:
+            # Durations parse transcript timestamps, so read each one once
+            duration = meeting.duration
+            start_time = meeting.start_time
 
-        table = Table(headers, alignments)
-        table.show_header = not self.args.no_header
+            if duration:
+                stats['total_duration_seconds'] += duration.total_seconds()
+                stats['meetings_with_duration'] += 1
+
+            if start_time:
+                # Track unique dates as day ordinals (no date objects needed);
+                # date-sorted listings repeat the same day, so skip the set
+                # insert when it matches the previous meeting's day
+                ordinal = start_time.toordinal()
+                if ordinal != previous_ordinal:
+                    unique_day_ordinals.add(ordinal)
+                    previous_ordinal = ordinal
 
-        for meeting in meetings:
             # Format each field
             meeting_id = format_meeting_id(meeting.id)
 
-            title = meeting.title or muted("Untitled")
-            if len(title) > 40:
-                title = title[:37] + "..."
+            title = meeting.title
+            title = _truncate(title, 40) if title else muted("Untitled")
 
             date_str = muted("Unknown")
-            if meeting.start_time:
-                date_str = meeting.start_time.strftime("%m/%d %H:%M")
+            if start_time:
+                # Same as strftime("%m/%d %H:%M") without the locale machinery
+                date_str = f"{start_time.month:02d}/{start_time.day:02d} {start_time.hour:02d}:{start_time.minute:02d}"
 
             # Try to get actual meeting duration
             duration_str = muted("Unknown")
             
             # First try the meeting's duration property (uses start/end times)
-            if meeting.duration:
-                duration_str = format_duration(meeting.duration.total_seconds())
+            if duration:
+                duration_str = format_duration(duration.total_seconds())
             else:
                 # Try to get duration from transcript timing
-                if meeting.has_transcript():
-                    try:
-                        transcript = meeting.transcript
-                        segments = transcript.segments
-                        if segments and len(segments) > 0:
-                            first = segments[0]
-                            last = segments[-1]
-                            if hasattr(last, 'end_time') and hasattr(first, 'start_time') and last.end_time and first.start_time:
-                                duration_seconds = last.end_time - first.start_time
-                                if duration_seconds > 60:  # Only show if > 1 minute
-                                    duration_str = format_duration(duration_seconds)
-                    except:
-                        pass
+                transcript = meeting.transcript
+                segments = transcript.segments if transcript else None
+                if segments:
+                    # Read each timing property once; both are None when missing
+                    first_start = segments[0].start_time
+                    last_end = segments[-1].end_time
+                    if last_end and first_start:
+                        duration_seconds = last_end - first_start
+                        if duration_seconds > 60:  # Only show if > 1 minute
+                            duration_str = format_duration(duration_seconds)
 
             # Get transcript word count
             transcript_str = muted("--")
@@ -370,16 +436,50 @@ class ListCommand:
                     notes_str = str(word_count)
 
             # Get folder name
-            folder_str = meeting.folder_name or muted("--")
-            if folder_str and len(folder_str) > 15:
-                folder_str = folder_str[:12] + "..."
+            folder_name = meeting.folder_name
+            folder_str = _truncate(folder_name, 15) if folder_name else muted("--")
+
+            yield [meeting_id, title, date_str, duration_str, transcript_str, summary_str, notes_str, folder_str]
+
+    def _format_table_output(self, meetings: List[Meeting]) -> None:
+        """
+        Format meetings as a table.
+
+        Args:
+            meetings: List of meetings to display
+        """
+        if not meetings:
+            print_info("No meetings found matching the criteria.")
+            return
+
+        # Create table
+        headers = ['ID', 'Title', 'Date', 'Duration', 'Transcript', 'Summary', 'Notes', 'Folder']
+        alignments = [
+            TableAlignment.LEFT,
+            TableAlignment.LEFT,
+            TableAlignment.LEFT,
+            TableAlignment.RIGHT,
+            TableAlignment.RIGHT,
+            TableAlignment.RIGHT,
+            TableAlignment.RIGHT,
+            TableAlignment.LEFT
+        ]
 
-            table.add_row([meeting_id, title, date_str, duration_str, transcript_str, summary_str, notes_str, folder_str])
+        table = Table(headers, alignments)
+        table.show_header = not self.args.no_header
+
+        stats = {
+            'total_meetings': len(meetings),
+            'total_duration_seconds': 0,
+            'meetings_with_duration': 0,
+            'unique_day_ordinals': set()
+        }
+        table.extend_rows(self._iter_table_rows(meetings, stats))
 
         table.print()
 
         # Add statistics at the bottom
-        stats = self._calculate_stats(meetings)
+        stats = self._finalize_stats(stats)
         if stats['total_meetings'] > 0:
             print()  # Empty line before stats
             total_duration_str = format_duration(stats['total_duration_seconds'])
@@ -408,32 +508,43 @@ class ListCommand:
             print_info("No meetings found matching the criteria.")
             return
 
+        # Collect every line and write them in one call
+        lines = []
         for i, meeting in enumerate(meetings):
             if i > 0:
-                print()
+                lines.append("")
 
             # Meeting header
             title = meeting.title or "Untitled Meeting"
-            print(colorize(title, Colors.HEADER))
+            lines.append(colorize(title, Colors.HEADER))
 
             # Meeting details
             details = []
 
-            if meeting.id:
-                details.append(f"ID: {format_meeting_id(meeting.id, max_length=12)}")
+            meeting_id = meeting.id
+            if meeting_id:
+                details.append(f"ID: {format_meeting_id(meeting_id, max_length=12)}")
 
-            if meeting.start_time:
-                details.append(f"Date: {meeting.start_time.strftime('%Y-%m-%d %H:%M')}")
+            start_time = meeting.start_time
+            if start_time:
+                details.append(
+                    f"Date: {start_time.year:04d}-{start_time.month:02d}-{start_time.day:02d} "
+                    f"{start_time.hour:02d}:{start_time.minute:02d}"
+                )
 
-            if meeting.duration:
-                duration_str = format_duration(meeting.duration.total_seconds())
+            duration = meeting.duration
+            if duration:
+                duration_str = format_duration(duration.total_seconds())
                 details.append(f"Duration: {duration_str}")
 
-            if meeting.participants:
-                details.append(f"Participants: {len(meeting.participants)}")
+            participants = meeting.participants
+            if participants:
+                details.append(f"Participants: {len(participants)}")
 
             if details:
-                print(muted(" | ".join(details)))
+                lines.append(muted(" | ".join(details)))
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _format_ids_output(self, meetings: List[Meeting]) -> None:
         """
@@ -442,9 +553,27 @@ class ListCommand:
         Args:
             meetings: List of meetings to display
         """
-        for meeting in meetings:
-            if meeting.id:
-                print(meeting.id)
+        self._write_ids(meeting.id for meeting in meetings)
+
+    def _format_record_ids_output(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Format raw meeting records as ID-only output.
+
+        Args:
+            records: List of raw meeting data dictionaries to display
+        """
+        self._write_ids(map(get_meeting_id, records))
+
+    def _write_ids(self, meeting_ids: Iterable[Optional[str]]) -> None:
+        """
+        Write meeting IDs to stdout, one per line, in a single write.
+
+        Args:
+            meeting_ids: Meeting IDs; missing (None or empty) IDs are skipped
+        """
+        output = "\n".join(filter(None, meeting_ids))
+        if output:
+            sys.stdout.write(output + "\n")
 
     def execute(self) -> int:
         """
@@ -453,32 +582,48 @@ class ListCommand:
         Returns:
             int: Exit code (0 for success)
         """
+        args = self.args
         try:
             # Load meetings with debug flag if verbose is enabled
-            debug_flag = getattr(self.args, 'verbose', False)
+            debug_flag = getattr(args, 'verbose', False)
             meeting_data = self.parser.get_meetings(debug=debug_flag)
-            meetings = [Meeting(data) for data in meeting_data]
 
-            if self.args.verbose:
-                print_info(f"Loaded {len(meetings)} meetings from cache")
+            if args.verbose:
+                print_info(f"Loaded {len(meeting_data)} meetings from cache")
 
-            # Apply filters
-            meetings = self._filter_meetings_by_date(meetings)
-            meetings = self._filter_meetings_by_title(meetings)
-            meetings = self._filter_meetings_by_participant(meetings)
-            meetings = self._filter_meetings_by_folder(meetings)
+            limit = args.limit if args.limit and args.limit > 0 else None
 
-            # Sort meetings
-            meetings = self._sort_meetings(meetings)
-
-            # Apply limit
-            if self.args.limit and self.args.limit > 0:
-                meetings = meetings[:self.args.limit]
+            # Apply all filters in a single pass, only wrapping matching records
+            filters = self._build_filters()
+            if filters is None:
+                meetings = []
+            else:
+                data_predicate, meeting_predicate = filters
+                if data_predicate is not None:
+                    meeting_data = [data for data in meeting_data if data_predicate(data)]
+
+                # IDs only: when neither filtering nor sorting needs a Meeting,
+                # sort and print the raw records without wrapping them
+                record_key = RECORD_SORT_KEYS.get(args.sort_by)
+                if args.format == 'ids' and meeting_predicate is None and record_key is not None:
+                    if meeting_data:
+                        meeting_data = self._sort_meetings(meeting_data, limit, record_key)
+                    self._format_record_ids_output(meeting_data)
+                    return 0
+
+                meetings = [Meeting(data) for data in meeting_data]
+                if meeting_predicate is not None:
+                    meetings = [meeting for meeting in meetings if meeting_predicate(meeting)]
+
+            # Sort meetings and apply limit (nothing to sort if no meeting matched)
+            if meetings:
+                meetings = self._sort_meetings(meetings, limit)
 
             # Format output
-            if self.args.format == 'simple':
+            output_format = args.format
+            if output_format == 'simple':
                 self._format_simple_output(meetings)
-            elif self.args.format == 'ids':
+            elif output_format == 'ids':
                 self._format_ids_output(meetings)
             else:  # table
                 self._format_table_output(meetings)
@@ -487,7 +632,7 @@ class ListCommand:
 
         except Exception as e:
             print_error(f"Error listing meetings: {e}")
-            if self.args.verbose:
+            if args.verbose:
                 import traceback
                 traceback.print_exc()
             return 1
\ No newline at end of file
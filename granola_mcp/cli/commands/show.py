@@ -6,7 +6,9 @@ including metadata, participants, summary, and transcript.
 """
 
 import argparse
-from typing import Optional
+import math
+import sys
+from typing import Any, Callable, Dict, Optional
 from ...core.parser import GranolaParser
 from ...core.meeting import Meeting
 from ..formatters.colors import (
@@ -15,6 +17,19 @@ from ..formatters.colors import (
 )
 from ..formatters.table import print_key_value_pairs, print_section, print_list_items
 
+# Raw fields left out of the detailed metadata (shown elsewhere or too large)
+_METADATA_SKIP_KEYS = frozenset({'transcript', 'transcription', 'content', 'text'})
+
+# Detailed metadata value formatters, by JSON value type
+_METADATA_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    str: str,
+    int: str,
+    float: str,
+    bool: str,
+    list: lambda value: f"List with {len(value)} items",
+    dict: lambda value: f"Object with {len(value)} fields",
+}
+
 
 class ShowCommand:
     """Command to show detailed meeting information."""
@@ -107,12 +122,10 @@ class ShowCommand:
         if meeting_data:
             return Meeting(meeting_data)
 
-        # Try partial ID match
-        all_meetings = self.parser.get_meetings()
-        for data in all_meetings:
-            meeting = Meeting(data)
-            if meeting.id and meeting.id.startswith(meeting_id):
-                return meeting
+        # Try partial ID match through the parser's sorted ID index
+        meeting_data = self.parser.find_meeting_by_id_prefix(meeting_id)
+        if meeting_data:
+            return Meeting(meeting_data)
 
         return None
 
@@ -140,11 +153,8 @@ class ShowCommand:
             details.append(("End Time", meeting.end_time.strftime("%Y-%m-%d %H:%M:%S %Z")))
 
         if meeting.duration:
-            duration_str = format_duration(meeting.duration.total_seconds())
-            # Remove ANSI codes for clean display
-            import re
-            ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-            duration_str = ansi_escape.sub('', duration_str)
+            # Plain formatting keeps ANSI codes out of the aligned value
+            duration_str = format_duration(meeting.duration.total_seconds(), plain=True)
             details.append(("Duration", duration_str))
 
         participants = meeting.participants
@@ -225,8 +235,7 @@ class ShowCommand:
             return
 
         print_section("Tags")
-        tag_items = [colorize(tag, Colors.CYAN) for tag in tags]
-        print(" ".join(tag_items))
+        print(" ".join(colorize(tag, Colors.CYAN) for tag in tags))
 
     def _show_metadata(self, meeting: Meeting) -> None:
         """
@@ -243,13 +252,10 @@ class ShowCommand:
 
         # Show all available fields
         for key, value in raw_data.items():
-            if key not in ['transcript', 'transcription', 'content', 'text']:
-                if isinstance(value, (str, int, float, bool)):
-                    metadata_items.append((key, str(value)))
-                elif isinstance(value, list):
-                    metadata_items.append((key, f"List with {len(value)} items"))
-                elif isinstance(value, dict):
-                    metadata_items.append((key, f"Object with {len(value)} fields"))
+            if key not in _METADATA_SKIP_KEYS:
+                formatter = _METADATA_FORMATTERS.get(type(value))
+                if formatter is not None:
+                    metadata_items.append((key, formatter(value)))
                 else:
                     metadata_items.append((key, type(value).__name__))
 
@@ -276,17 +282,23 @@ class ShowCommand:
             print(transcript.full_text)
             return
 
+        # Read display options once rather than per segment
+        args = self.args
+        show_speakers = not args.no_speakers
+        show_timestamps = args.timestamps
+
         # Filter by speaker if requested
-        if self.args.speaker:
+        if args.speaker:
+            speaker_term = args.speaker.lower()
             segments = [s for s in segments if s.speaker and
-                       self.args.speaker.lower() in s.speaker.lower()]
+                       speaker_term in s.speaker.lower()]
             if not segments:
-                print_info(f"No transcript segments found for speaker: {self.args.speaker}")
+                print_info(f"No transcript segments found for speaker: {args.speaker}")
                 return
 
-        # Display segments
+        # Display segments, collecting the lines and writing them at once
         current_speaker = None
-        show_speakers = not self.args.no_speakers
+        lines = []
 
         for segment in segments:
             text = segment.text.strip()
@@ -298,23 +310,27 @@ class ShowCommand:
             # Show speaker header if changed and speakers are enabled
             if show_speakers and speaker and speaker != current_speaker:
                 if current_speaker is not None:
-                    print()  # Add spacing between speakers
-                print(bold(f"{speaker}:"))
+                    lines.append("")  # Add spacing between speakers
+                lines.append(bold(f"{speaker}:"))
                 current_speaker = speaker
 
             # Format timestamp if requested
             timestamp_prefix = ""
-            if self.args.timestamps and segment.start_time is not None:
-                minutes = int(segment.start_time // 60)
-                seconds = int(segment.start_time % 60)
-                timestamp_prefix = muted(f"[{minutes:02d}:{seconds:02d}] ")
+            if show_timestamps:
+                start_time = segment.start_time
+                if start_time is not None:
+                    minutes, seconds = divmod(math.floor(start_time), 60)
+                    timestamp_prefix = muted(f"[{minutes:02d}:{seconds:02d}] ")
 
             # Display the text
             if show_speakers and speaker:
-                print(f"  {timestamp_prefix}{text}")
+                lines.append(f"  {timestamp_prefix}{text}")
             else:
                 speaker_name = speaker or "Unknown"
-                print(f"{timestamp_prefix}{bold(speaker_name + ':')} {text}")
+                lines.append(f"{timestamp_prefix}{bold(speaker_name + ':')} {text}")
+
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
     def execute(self) -> int:
         """
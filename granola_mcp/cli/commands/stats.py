@@ -7,11 +7,14 @@ frequency analysis, duration distribution, participant tracking, and time patter
 
 import argparse
 import datetime
-import statistics
-from collections import defaultdict, Counter
-from typing import List, Dict, Any, Optional, Tuple
+import math
+from collections import Counter
+from functools import cached_property
+from itertools import chain
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
 from ...core.parser import GranolaParser
-from ...core.meeting import Meeting
+from ...core.meeting import Meeting, get_meeting_start_time_utc
+from ...core.transcript import Transcript
 from ...utils.date_parser import parse_date, get_date_range
 from ..formatters.colors import (
     Colors, colorize, format_duration, format_participant_count,
@@ -22,6 +25,124 @@ from ..formatters.charts import (
     create_time_pattern_chart, create_day_pattern_chart, create_summary_box
 )
 
+# Weekday names indexed by datetime.weekday() (0=Monday)
+_WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+def _median_of_sorted(values: List[Union[int, float]]) -> Union[int, float]:
+    """
+    Get the median of a non-empty sorted list.
+
+    Matches statistics.median, averaging the two middle values when the
+    list has an even length.
+
+    Args:
+        values: Sorted numeric values
+
+    Returns:
+        Union[int, float]: Median value
+    """
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2
+
+
+def _count_meetings_per_day(start_times: List[datetime.datetime]) -> Counter:
+    """
+    Count meetings per calendar day.
+
+    Args:
+        start_times: Meeting start times
+
+    Returns:
+        Counter: Meeting count keyed by date
+    """
+    return Counter(start_time.date() for start_time in start_times)
+
+
+def _resample_counts(daily_counts: Counter,
+                     bucket: Callable[[datetime.date], Hashable]) -> Counter:
+    """
+    Roll daily meeting counts up into coarser buckets.
+
+    There are never more days than meetings, so grouping the daily counts
+    is cheaper than deriving a bucket key from every meeting. Buckets are
+    keyed in the order they are first reached, so chronological days with
+    a bucket function that never goes backwards give chronological buckets.
+
+    Args:
+        daily_counts: Meeting count keyed by date
+        bucket: Maps a date to the key of the bucket it falls in
+
+    Returns:
+        Counter: Meeting count keyed by bucket
+    """
+    resampled = Counter()
+    for day, count in daily_counts.items():
+        resampled[bucket(day)] += count
+    return resampled
+
+
+def _week_start_ordinal(day: datetime.date) -> int:
+    """Get the proleptic Gregorian ordinal of the Monday of a date's week."""
+    return day.toordinal() - day.weekday()
+
+
+def _month_key(day: datetime.date) -> Tuple[int, int]:
+    """Get the (year, month) a date falls in."""
+    return day.year, day.month
+
+
+class MeetingColumns:
+    """
+    Column view of the meetings selected for analysis.
+
+    Each per-meeting field the analyzers use is read into its own list the
+    first time an analyzer asks for it, then shared by every later analyzer,
+    so a single analysis only pays for the fields it reads.
+    """
+
+    def __init__(self, meetings: List[Meeting]):
+        """
+        Build the column view over a list of meetings.
+
+        Args:
+            meetings: Meetings to analyze
+        """
+        self._meetings = meetings
+        self.meeting_count = len(meetings)
+
+    @cached_property
+    def start_times(self) -> List[datetime.datetime]:
+        """Start times of the meetings that have one."""
+        return [start_time for start_time in (m.start_time for m in self._meetings) if start_time]
+
+    @cached_property
+    def sorted_start_times(self) -> List[datetime.datetime]:
+        """Start times in chronological order."""
+        return sorted(self.start_times)
+
+    @cached_property
+    def daily_counts(self) -> Counter:
+        """Meeting count per calendar day, with days in chronological order."""
+        return _count_meetings_per_day(self.sorted_start_times)
+
+    @cached_property
+    def duration_seconds(self) -> List[float]:
+        """Durations in seconds of the meetings that have one."""
+        return [duration.total_seconds() for duration in (m.duration for m in self._meetings) if duration]
+
+    @cached_property
+    def transcripts(self) -> List[Transcript]:
+        """Transcripts of the meetings that have one."""
+        return [transcript for transcript in (m.transcript for m in self._meetings) if transcript is not None]
+
+    @cached_property
+    def participant_lists(self) -> List[List[str]]:
+        """Participants of every meeting, empty when none are known."""
+        return [m.participants for m in self._meetings]
+
 
 class StatsCommand:
     """Command to generate meeting statistics and visualizations."""
@@ -37,6 +158,14 @@ class StatsCommand:
         self.parser = parser
         self.args = args
 
+        # Date bounds, parsed once; an invalid date is reported on execute
+        self._date_bounds: Optional[Tuple[datetime.datetime, datetime.datetime]] = None
+        self._date_error: Optional[str] = None
+        try:
+            self._date_bounds = self._parse_date_bounds()
+        except ValueError as e:
+            self._date_error = str(e)
+
     @staticmethod
     def add_arguments(parser: argparse.ArgumentParser) -> None:
         """
@@ -143,68 +272,80 @@ class StatsCommand:
             help='Width for ASCII charts'
         )
 
-    def _filter_meetings_by_date(self, meetings: List[Meeting]) -> List[Meeting]:
+    def _parse_date_bounds(self) -> Optional[Tuple[datetime.datetime, datetime.datetime]]:
         """
-        Filter meetings by date criteria.
-
-        Args:
-            meetings: List of meetings to filter
+        Parse the date filter arguments into a (start, end) range.
 
         Returns:
-            List[Meeting]: Filtered meetings
-        """
-        if not self.args.last and not self.args.from_date:
-            return meetings
-
-        try:
-            if self.args.last:
-                # Filter by relative date
-                start_date = parse_date(self.args.last)
-                end_date = datetime.datetime.now(start_date.tzinfo)
-            else:
-                # Filter by date range
-                start_date, end_date = get_date_range(
-                    self.args.from_date,
-                    self.args.to_date
-                )
+            Optional[Tuple[datetime.datetime, datetime.datetime]]: Date range,
+            or None if no date filter was given
 
-            filtered_meetings = []
-            for meeting in meetings:
-                if meeting.start_time and start_date <= meeting.start_time <= end_date:
-                    filtered_meetings.append(meeting)
+        Raises:
+            ValueError: If a date argument is invalid
+        """
+        args = self.args
+        if args.last:
+            # Filter by relative date
+            start_date = parse_date(args.last)
+            end_date = datetime.datetime.now(start_date.tzinfo)
+            return start_date, end_date
 
-            return filtered_meetings
+        if args.from_date:
+            # Filter by date range
+            return get_date_range(args.from_date, args.to_date)
 
-        except ValueError as e:
-            print_error(f"Invalid date format: {e}")
-            return []
+        return None
 
-    def _filter_meetings_by_folder(self, meetings: List[Meeting]) -> List[Meeting]:
+    def _filter_meetings(self, meeting_data: List[Dict[str, Any]]) -> Tuple[List[Meeting], int]:
         """
-        Filter meetings by folder name.
+        Filter meetings by date and folder criteria in a single pass.
+
+        Both checks run on the raw meeting data, so only matching records are
+        wrapped in Meeting objects.
 
         Args:
-            meetings: List of meetings to filter
+            meeting_data: Raw meeting data from the cache
 
         Returns:
-            List[Meeting]: Filtered meetings
+            Tuple[List[Meeting], int]: Meetings matching all criteria, and the
+            number of meetings matching the date criteria alone
         """
-        if not self.args.folder:
-            return meetings
+        if self._date_error is not None:
+            print_error(f"Invalid date format: {self._date_error}")
+            return [], 0
 
-        folder_name = self.args.folder.lower()
-        filtered_meetings = []
-        
-        for meeting in meetings:
-            meeting_folder = meeting.folder_name
-            if meeting_folder and meeting_folder.lower() == folder_name:
-                filtered_meetings.append(meeting)
-
-        return filtered_meetings
+        date_bounds = self._date_bounds
+        folder_name = self.args.folder.lower() if self.args.folder else None
+        # Whether each distinct folder name matches; meetings share a handful
+        # of folders, so each name is lowercased once
+        folder_matches: Dict[str, bool] = {}
 
-    def _analyze_meetings_per_day(self, meetings: List[Meeting]) -> None:
+        filtered_meetings = []
+        date_matches = 0
+        for data in meeting_data:
+            if date_bounds is not None:
+                start_time = get_meeting_start_time_utc(data)
+                if start_time is None or not date_bounds[0] <= start_time <= date_bounds[1]:
+                    continue
+            date_matches += 1
+
+            if folder_name is not None:
+                meeting_folder = data.get('folder_name')
+                if not meeting_folder:
+                    continue
+                matches = folder_matches.get(meeting_folder)
+                if matches is None:
+                    matches = folder_matches[meeting_folder] = meeting_folder.lower() == folder_name
+                if not matches:
+                    continue
+
+            filtered_meetings.append(Meeting(data))
+
+        return filtered_meetings, date_matches
+
+    def _analyze_meetings_per_day(self, columns: MeetingColumns) -> None:
         """Analyze and display meetings per day."""
-        if not meetings:
+        if not columns.meeting_count:
             print_info("No meetings found for analysis.")
             return
 
@@ -212,25 +353,21 @@ class StatsCommand:
         print()
 
         # Group meetings by date
-        daily_counts = defaultdict(int)
-        for meeting in meetings:
-            if meeting.start_time:
-                date_key = meeting.start_time.date()
-                daily_counts[date_key] += 1
+        daily_counts = columns.daily_counts
 
         if not daily_counts:
             print_info("No meetings with valid dates found.")
             return
 
-        # Sort by date
-        sorted_dates = sorted(daily_counts.keys())
+        # Days were counted from sorted start times, so they are in order
+        sorted_dates = list(daily_counts)
 
-        # Calculate statistics
-        counts = list(daily_counts.values())
-        avg_per_day = statistics.mean(counts)
-        max_per_day = max(counts)
+        # Calculate statistics; only days with meetings are counted, so
+        # every day in the counter has at least one
         total_days = len(daily_counts)
-        total_meetings = sum(counts)
+        total_meetings = sum(daily_counts.values())
+        avg_per_day = total_meetings / total_days
+        max_per_day = max(daily_counts.values())
 
         # Display summary
         summary_stats = {
@@ -238,7 +375,7 @@ class StatsCommand:
             "Total Meetings": total_meetings,
             "Average per Day": f"{avg_per_day:.1f}",
             "Max per Day": max_per_day,
-            "Days with Meetings": len([c for c in counts if c > 0])
+            "Days with Meetings": total_days
         }
 
         print(create_summary_box(summary_stats, "Daily Meeting Summary"))
@@ -263,36 +400,31 @@ class StatsCommand:
                 color=Colors.BLUE
             ))
 
-    def _analyze_meetings_per_week(self, meetings: List[Meeting]) -> None:
+    def _analyze_meetings_per_week(self, columns: MeetingColumns) -> None:
         """Analyze and display meetings per week."""
-        if not meetings:
+        if not columns.meeting_count:
             print_info("No meetings found for analysis.")
             return
 
         print_header("📊 Meetings Per Week Analysis")
         print()
 
-        # Group meetings by week
-        weekly_counts = defaultdict(int)
-        for meeting in meetings:
-            if meeting.start_time:
-                # Get Monday of the week
-                monday = meeting.start_time.date() - datetime.timedelta(days=meeting.start_time.weekday())
-                weekly_counts[monday] += 1
+        # Group meetings by week, keyed by the ordinal of each week's Monday
+        weekly_counts = _resample_counts(columns.daily_counts, _week_start_ordinal)
 
         if not weekly_counts:
             print_info("No meetings with valid dates found.")
             return
 
-        # Sort by week
-        sorted_weeks = sorted(weekly_counts.keys())
+        # Weeks were rolled up from days in order, so they are in order
+        sorted_weeks = list(weekly_counts)
 
-        # Calculate statistics
-        counts = list(weekly_counts.values())
-        avg_per_week = statistics.mean(counts)
-        max_per_week = max(counts)
+        # Calculate statistics; only weeks with meetings are counted, so
+        # every week in the counter has at least one
         total_weeks = len(weekly_counts)
-        total_meetings = sum(counts)
+        total_meetings = sum(weekly_counts.values())
+        avg_per_week = total_meetings / total_weeks
+        max_per_week = max(weekly_counts.values())
 
         # Display summary
         summary_stats = {
@@ -300,7 +432,7 @@ class StatsCommand:
             "Total Meetings": total_meetings,
             "Average per Week": f"{avg_per_week:.1f}",
             "Max per Week": max_per_week,
-            "Weeks with Meetings": len([c for c in counts if c > 0])
+            "Weeks with Meetings": total_weeks
         }
 
         print(create_summary_box(summary_stats, "Weekly Meeting Summary"))
@@ -311,7 +443,7 @@ class StatsCommand:
             chart_data = []
             for week_start in sorted_weeks:
                 count = weekly_counts[week_start]
-                week_str = week_start.strftime("%m/%d")
+                week_str = datetime.date.fromordinal(week_start).strftime("%m/%d")
                 chart_data.append((week_str, count))
 
             chart_title = f"Meetings Per Week ({len(chart_data)} weeks)"
@@ -322,9 +454,9 @@ class StatsCommand:
                 color=Colors.GREEN
             ))
 
-    def _analyze_meetings_per_month(self, meetings: List[Meeting]) -> None:
+    def _analyze_meetings_per_month(self, columns: MeetingColumns) -> None:
         """Analyze and display meetings per month."""
-        if not meetings:
+        if not columns.meeting_count:
             print_info("No meetings found for analysis.")
             return
 
@@ -332,25 +464,21 @@ class StatsCommand:
         print()
 
         # Group meetings by month
-        monthly_counts = defaultdict(int)
-        for meeting in meetings:
-            if meeting.start_time:
-                month_key = (meeting.start_time.year, meeting.start_time.month)
-                monthly_counts[month_key] += 1
+        monthly_counts = _resample_counts(columns.daily_counts, _month_key)
 
         if not monthly_counts:
             print_info("No meetings with valid dates found.")
             return
 
-        # Sort by month
-        sorted_months = sorted(monthly_counts.keys())
+        # Months were rolled up from days in order, so they are in order
+        sorted_months = list(monthly_counts)
 
-        # Calculate statistics
-        counts = list(monthly_counts.values())
-        avg_per_month = statistics.mean(counts)
-        max_per_month = max(counts)
+        # Calculate statistics; only months with meetings are counted, so
+        # every month in the counter has at least one
         total_months = len(monthly_counts)
-        total_meetings = sum(counts)
+        total_meetings = sum(monthly_counts.values())
+        avg_per_month = total_meetings / total_months
+        max_per_month = max(monthly_counts.values())
 
         # Display summary
         summary_stats = {
@@ -358,7 +486,7 @@ class StatsCommand:
             "Total Meetings": total_meetings,
             "Average per Month": f"{avg_per_month:.1f}",
             "Max per Month": max_per_month,
-            "Months with Meetings": len([c for c in counts if c > 0])
+            "Months with Meetings": total_months
         }
 
         print(create_summary_box(summary_stats, "Monthly Meeting Summary"))
@@ -380,37 +508,40 @@ class StatsCommand:
                 color=Colors.CYAN
             ))
 
-    def _analyze_duration_distribution(self, meetings: List[Meeting]) -> None:
+    def _analyze_duration_distribution(self, columns: MeetingColumns) -> None:
         """Analyze and display meeting duration distribution."""
         print_header("⏱️  Meeting Duration Distribution")
         print()
 
-        # Extract durations in minutes
-        durations = []
-        for meeting in meetings:
-            if meeting.duration:
-                duration_minutes = meeting.duration.total_seconds() / 60
-                durations.append(duration_minutes)
+        # Extract durations in minutes, sorted so min, max and median can be
+        # read off the ends and middle
+        durations = sorted(seconds / 60 for seconds in columns.duration_seconds)
 
         if not durations:
             print_info("No meetings with duration data found.")
             return
 
-        # Calculate statistics
-        avg_duration = statistics.mean(durations)
-        median_duration = statistics.median(durations)
-        min_duration = min(durations)
-        max_duration = max(durations)
-
-        try:
-            stdev_duration = statistics.stdev(durations) if len(durations) > 1 else 0
-        except statistics.StatisticsError:
+        # Calculate statistics with plain float arithmetic rather than the
+        # exact fraction math of statistics.mean and statistics.stdev; the
+        # average is taken over whole seconds so it truncates like the exact
+        # mean did
+        count = len(durations)
+        avg_duration_seconds = sum(columns.duration_seconds) / count
+        avg_duration = avg_duration_seconds / 60
+        median_duration = _median_of_sorted(durations)
+        min_duration = durations[0]
+        max_duration = durations[-1]
+
+        if count > 1:
+            variance = sum((d - avg_duration) ** 2 for d in durations) / (count - 1)
+            stdev_duration = math.sqrt(variance)
+        else:
             stdev_duration = 0
 
         # Display summary
         summary_stats = {
             "Total Meetings": len(durations),
-            "Average Duration": format_duration(avg_duration * 60),
+            "Average Duration": format_duration(avg_duration_seconds),
             "Median Duration": format_duration(median_duration * 60),
             "Min Duration": format_duration(min_duration * 60),
             "Max Duration": format_duration(max_duration * 60),
@@ -426,23 +557,19 @@ class StatsCommand:
                 durations,
                 bins=10,
                 title="Duration Distribution (minutes)",
-                width=self.args.chart_width
+                width=self.args.chart_width,
+                value_range=(min_duration, max_duration)
             ))
 
-    def _analyze_participant_frequency(self, meetings: List[Meeting]) -> None:
+    def _analyze_participant_frequency(self, columns: MeetingColumns) -> None:
         """Analyze and display participant frequency."""
         print_header("👥 Participant Frequency Analysis")
         print()
 
         # Count participant occurrences
-        participant_counts = Counter()
-        meeting_sizes = []
-
-        for meeting in meetings:
-            participants = meeting.participants
-            meeting_sizes.append(len(participants))
-            for participant in participants:
-                participant_counts[participant] += 1
+        participant_lists = columns.participant_lists
+        participant_counts = Counter(chain.from_iterable(participant_lists))
+        meeting_sizes = list(map(len, participant_lists))
 
         if not participant_counts:
             print_info("No participant data found.")
@@ -451,7 +578,7 @@ class StatsCommand:
         # Calculate statistics
         total_participants = len(participant_counts)
         total_participations = sum(participant_counts.values())
-        avg_meeting_size = statistics.mean(meeting_sizes) if meeting_sizes else 0
+        avg_meeting_size = sum(meeting_sizes) / len(meeting_sizes) if meeting_sizes else 0
 
         # Display summary
         summary_stats = {
@@ -483,21 +610,15 @@ class StatsCommand:
                     color=Colors.MAGENTA
                 ))
 
-    def _analyze_time_patterns(self, meetings: List[Meeting]) -> None:
+    def _analyze_time_patterns(self, columns: MeetingColumns) -> None:
         """Analyze and display meeting time patterns."""
         print_header("🕐 Meeting Time Patterns")
         print()
 
-        # Analyze by hour of day
-        hourly_counts = defaultdict(int)
-        daily_counts = defaultdict(int)  # 0=Monday, 6=Sunday
-
-        for meeting in meetings:
-            if meeting.start_time:
-                hour = meeting.start_time.hour
-                day_of_week = meeting.start_time.weekday()
-                hourly_counts[hour] += 1
-                daily_counts[day_of_week] += 1
+        # Analyze by hour of day and day of week (0=Monday, 6=Sunday)
+        start_times = columns.start_times
+        hourly_counts = Counter(start_time.hour for start_time in start_times)
+        daily_counts = Counter(start_time.weekday() for start_time in start_times)
 
         if not hourly_counts and not daily_counts:
             print_info("No meetings with time data found.")
@@ -519,12 +640,11 @@ class StatsCommand:
             print_info(f"Peak meeting hour: {peak_hour_str} ({peak_hour[1]} meetings)")
 
         if daily_counts:
-            days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
             peak_day = max(daily_counts.items(), key=lambda x: x[1])
-            peak_day_str = days[peak_day[0]]
+            peak_day_str = _WEEKDAY_NAMES[peak_day[0]]
             print_info(f"Peak meeting day: {peak_day_str} ({peak_day[1]} meetings)")
 
-    def _analyze_word_analysis(self, meetings: List[Meeting]) -> None:
+    def _analyze_word_analysis(self, columns: MeetingColumns) -> None:
         """Analyze transcript word counts and content."""
         print_header("📝 Transcript Word Analysis")
         print()
@@ -533,13 +653,12 @@ class StatsCommand:
         meetings_with_transcripts = 0
         total_words = 0
 
-        for meeting in meetings:
-            if meeting.has_transcript() and meeting.transcript:
+        for transcript in columns.transcripts:
+            if transcript:
                 meetings_with_transcripts += 1
                 # Simple word count (split by whitespace)
-                transcript_text = meeting.transcript.full_text
-                if transcript_text:
-                    word_count = len(transcript_text.split())
+                if transcript.full_text:
+                    word_count = transcript.word_count
                     transcript_lengths.append(word_count)
                     total_words += word_count
 
@@ -548,16 +667,17 @@ class StatsCommand:
             return
 
         # Calculate statistics
-        avg_words = statistics.mean(transcript_lengths)
-        median_words = statistics.median(transcript_lengths)
-        min_words = min(transcript_lengths)
-        max_words = max(transcript_lengths)
+        transcript_lengths.sort()
+        avg_words = total_words / len(transcript_lengths)
+        median_words = _median_of_sorted(transcript_lengths)
+        min_words = transcript_lengths[0]
+        max_words = transcript_lengths[-1]
 
         # Display summary
         summary_stats = {
             "Meetings with Transcripts": meetings_with_transcripts,
-            "Total Meetings": len(meetings),
-            "Coverage": f"{(meetings_with_transcripts/len(meetings)*100):.1f}%",
+            "Total Meetings": columns.meeting_count,
+            "Coverage": f"{(meetings_with_transcripts/columns.meeting_count*100):.1f}%",
             "Total Words": f"{total_words:,}",
             "Average Words/Meeting": f"{avg_words:.0f}",
             "Median Words/Meeting": f"{median_words:.0f}"
@@ -572,42 +692,44 @@ class StatsCommand:
                 transcript_lengths,
                 bins=8,
                 title="Transcript Length Distribution (words)",
-                width=self.args.chart_width
+                width=self.args.chart_width,
+                value_range=(min_words, max_words)
             ))
 
-    def _show_comprehensive_summary(self, meetings: List[Meeting]) -> None:
+    def _show_comprehensive_summary(self, columns: MeetingColumns) -> None:
         """Show a comprehensive statistics summary."""
         print_header("📊 Comprehensive Meeting Statistics")
         print()
 
-        if not meetings:
+        total_meetings = columns.meeting_count
+        if not total_meetings:
             print_info("No meetings found for analysis.")
             return
 
         # Basic counts
-        total_meetings = len(meetings)
-        meetings_with_dates = len([m for m in meetings if m.start_time])
-        meetings_with_durations = len([m for m in meetings if m.duration])
-        meetings_with_transcripts = len([m for m in meetings if m.has_transcript()])
+        start_times = columns.start_times
+        duration_seconds = columns.duration_seconds
+        meetings_with_dates = len(start_times)
+        meetings_with_durations = len(duration_seconds)
+        meetings_with_transcripts = len(columns.transcripts)
 
         # Date range
-        dates = [m.start_time for m in meetings if m.start_time]
         date_range = ""
-        if dates:
-            earliest = min(dates)
-            latest = max(dates)
+        if start_times:
+            earliest = min(start_times)
+            latest = max(start_times)
             date_range = f"{earliest.strftime('%Y-%m-%d')} to {latest.strftime('%Y-%m-%d')}"
 
-        # Duration statistics
-        durations = [m.duration.total_seconds() / 60 for m in meetings if m.duration]
-        avg_duration = statistics.mean(durations) if durations else 0
-        total_duration = sum(durations) if durations else 0
+        # Duration statistics (averaged in seconds, which are exact, so the
+        # plain division does not drift below a whole second)
+        total_duration = sum(seconds / 60 for seconds in duration_seconds)
+        avg_duration_seconds = (sum(duration_seconds) / meetings_with_durations
+                                if meetings_with_durations else 0)
 
         # Participant statistics
         all_participants = set()
         total_participations = 0
-        for meeting in meetings:
-            participants = meeting.participants
+        for participants in columns.participant_lists:
             all_participants.update(participants)
             total_participations += len(participants)
 
@@ -619,7 +741,7 @@ class StatsCommand:
             "Meetings with Durations": f"{meetings_with_durations} ({meetings_with_durations/total_meetings*100:.1f}%)",
             "Meetings with Transcripts": f"{meetings_with_transcripts} ({meetings_with_transcripts/total_meetings*100:.1f}%)",
             "Total Duration": format_duration(total_duration * 60),
-            "Average Duration": format_duration(avg_duration * 60),
+            "Average Duration": format_duration(avg_duration_seconds),
             "Unique Participants": len(all_participants),
             "Total Participations": total_participations,
             "Avg Participants/Meeting": f"{total_participations/total_meetings:.1f}" if total_meetings > 0 else "0"
@@ -637,58 +759,56 @@ class StatsCommand:
         try:
             # Load meetings
             meeting_data = self.parser.get_meetings()
-            meetings = [Meeting(data) for data in meeting_data]
 
             if self.args.verbose:
-                print_info(f"Loaded {len(meetings)} meetings from cache")
-
-            # Apply date filters
-            meetings = self._filter_meetings_by_date(meetings)
+                print_info(f"Loaded {len(meeting_data)} meetings from cache")
 
-            if self.args.verbose and len(meetings) != len(meeting_data):
-                print_info(f"Filtered to {len(meetings)} meetings based on date criteria")
+            # Apply date and folder filters
+            meetings, date_matches = self._filter_meetings(meeting_data)
 
-            # Apply folder filters
-            original_count = len(meetings)
-            meetings = self._filter_meetings_by_folder(meetings)
+            if self.args.verbose and date_matches != len(meeting_data):
+                print_info(f"Filtered to {date_matches} meetings based on date criteria")
 
-            if self.args.verbose and len(meetings) != original_count and self.args.folder:
+            if self.args.verbose and len(meetings) != date_matches and self.args.folder:
                 print_info(f"Filtered to {len(meetings)} meetings in folder '{self.args.folder}'")
 
+            # Read the fields the analyzers need once for all of them
+            columns = MeetingColumns(meetings)
+
             # Execute the appropriate analysis
             if self.args.meetings_per_day:
-                self._analyze_meetings_per_day(meetings)
+                self._analyze_meetings_per_day(columns)
             elif self.args.meetings_per_week:
-                self._analyze_meetings_per_week(meetings)
+                self._analyze_meetings_per_week(columns)
             elif self.args.meetings_per_month:
-                self._analyze_meetings_per_month(meetings)
+                self._analyze_meetings_per_month(columns)
             elif self.args.duration_distribution:
-                self._analyze_duration_distribution(meetings)
+                self._analyze_duration_distribution(columns)
             elif self.args.participant_frequency:
-                self._analyze_participant_frequency(meetings)
+                self._analyze_participant_frequency(columns)
             elif self.args.time_patterns:
-                self._analyze_time_patterns(meetings)
+                self._analyze_time_patterns(columns)
             elif self.args.word_analysis:
-                self._analyze_word_analysis(meetings)
+                self._analyze_word_analysis(columns)
             elif self.args.summary:
-                self._show_comprehensive_summary(meetings)
+                self._show_comprehensive_summary(columns)
             elif self.args.all:
                 # Show all analyses
-                self._show_comprehensive_summary(meetings)
+                self._show_comprehensive_summary(columns)
                 print("\n" + "="*60 + "\n")
-                self._analyze_meetings_per_day(meetings)
+                self._analyze_meetings_per_day(columns)
                 print("\n" + "="*60 + "\n")
-                self._analyze_duration_distribution(meetings)
+                self._analyze_duration_distribution(columns)
                 print("\n" + "="*60 + "\n")
-                self._analyze_participant_frequency(meetings)
+                self._analyze_participant_frequency(columns)
                 print("\n" + "="*60 + "\n")
-                self._analyze_time_patterns(meetings)
-                if any(m.has_transcript() for m in meetings):
+                self._analyze_time_patterns(columns)
+                if columns.transcripts:
                     print("\n" + "="*60 + "\n")
-                    self._analyze_word_analysis(meetings)
+                    self._analyze_word_analysis(columns)
             else:
                 # Default to summary
-                self._show_comprehensive_summary(meetings)
+                self._show_comprehensive_summary(columns)
 
             return 0
 
@@ -5,9 +5,10 @@ Provides functions for creating terminal-friendly charts and visualizations
 using Unicode box-drawing characters and ANSI colors.
 """
 
+import functools
 import math
 import shutil
-from typing import List, Tuple, Dict, Any, Optional, Union
+from typing import List, Tuple, Dict, Any, Iterable, Optional, Union
 from .colors import Colors, colorize, muted, header, subheader
 
 
@@ -56,14 +57,65 @@ class ChartConfig:
     MIN_HEIGHT = 5
 
 
+# Partial blocks indexed by ceil(remainder * 8), where remainder is the
+# fractional part of a bar: up to an eighth adds nothing, and each further
+# eighth steps up one block size
+_PARTIAL_BLOCKS = (
+    "",
+    "",
+    ChartConfig.EIGHTH_BLOCK,
+    ChartConfig.QUARTER_BLOCK,
+    ChartConfig.THREE_EIGHTHS,
+    ChartConfig.HALF_BLOCK,
+    ChartConfig.FIVE_EIGHTHS,
+    ChartConfig.THREE_QUARTERS,
+    ChartConfig.SEVEN_EIGHTHS,
+)
+
+# 12-hour clock labels indexed by hour of day (0-23)
+_HOUR_LABELS = tuple(
+    f"{(hour - 1) % 12 + 1}{'AM' if hour < 12 else 'PM'}" for hour in range(24)
+)
+
+# Short weekday labels indexed by weekday (0=Monday)
+_DAY_LABELS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+@functools.lru_cache(maxsize=1)
 def get_terminal_width() -> int:
-    """Get the current terminal width."""
+    """
+    Get the terminal width.
+
+    Measured once per process, since every chart of a command is rendered
+    for the same terminal; call get_terminal_width.cache_clear() to
+    measure again.
+    """
     try:
         return shutil.get_terminal_size().columns
-    except:
+    except OSError:
         return 80
 
 
+def _minmax(data: Iterable[Union[int, float]]) -> Tuple[Union[int, float], Union[int, float]]:
+    """
+    Find the smallest and largest values of non-empty data in one pass.
+
+    Args:
+        data: Numeric values (at least one)
+
+    Returns:
+        Tuple: (min, max) of the data
+    """
+    values = iter(data)
+    low = high = next(values)
+    for value in values:
+        if value < low:
+            low = value
+        elif value > high:
+            high = value
+    return low, high
+
+
 def normalize_data(data: List[Union[int, float]], max_value: Optional[float] = None) -> List[float]:
     """
     Normalize data to 0-1 range for charting.
@@ -138,37 +190,34 @@ def create_bar_chart(
         lines.append(header(title))
         lines.append("")
 
+    # Without colors, bars and values are used as-is instead of passing
+    # each one through colorize()
+    use_colors = Colors.is_enabled()
+
+    # Bind the block character once instead of looking it up per bar
+    full_block = ChartConfig.FULL_BLOCK
+
     # Create bars
     for label, value in data:
         # Normalize value to bar width
         if max_value > 0:
-            bar_length = int((value / max_value) * bar_width)
-            remainder = ((value / max_value) * bar_width) - bar_length
+            scaled = (value / max_value) * bar_width
+            bar_length = int(scaled)
+            remainder = scaled - bar_length
         else:
             bar_length = 0
             remainder = 0
 
         # Create the bar
-        full_blocks = ChartConfig.FULL_BLOCK * bar_length
-
-        # Add partial block for remainder
-        partial_block = ""
-        if remainder > 0.875:
-            partial_block = ChartConfig.SEVEN_EIGHTHS
-        elif remainder > 0.75:
-            partial_block = ChartConfig.THREE_QUARTERS
-        elif remainder > 0.625:
-            partial_block = ChartConfig.FIVE_EIGHTHS
-        elif remainder > 0.5:
-            partial_block = ChartConfig.HALF_BLOCK
-        elif remainder > 0.375:
-            partial_block = ChartConfig.THREE_EIGHTHS
-        elif remainder > 0.25:
-            partial_block = ChartConfig.QUARTER_BLOCK
-        elif remainder > 0.125:
-            partial_block = ChartConfig.EIGHTH_BLOCK
-
-        bar = colorize(full_blocks + partial_block, color)
+        full_blocks = full_block * bar_length
+
+        # Add partial block for remainder (scaling by 8 is exact in binary
+        # floating point, so this matches comparing against each eighth)
+        partial_block = _PARTIAL_BLOCKS[math.ceil(remainder * 8)] if remainder > 0 else ""
+
+        bar = full_blocks + partial_block
+        if use_colors:
+            bar = colorize(bar, color)
 
         # Format the line
         label_padded = label.ljust(max_label_len)
@@ -177,7 +226,9 @@ def create_bar_chart(
                 value_str = f"{value:.1f}".rjust(8)
             else:
                 value_str = str(value).rjust(8)
-            line = f"{label_padded} {bar} {muted(value_str)}"
+            if use_colors:
+                value_str = muted(value_str)
+            line = f"{label_padded} {bar} {value_str}"
         else:
             line = f"{label_padded} {bar}"
 
@@ -186,19 +237,51 @@ def create_bar_chart(
     return "\n".join(lines)
 
 
-def create_histogram(
-    data: List[Union[int, float]],
-    bins: int = 10,
+def histogram_bins(
+    data: Iterable[Union[int, float]],
+    bins: int,
+    min_val: Union[int, float],
+    max_val: Union[int, float]
+) -> List[int]:
+    """
+    Count numeric values into equal-width histogram bins.
+
+    Args:
+        data: Numeric values, all within [min_val, max_val]
+        bins: Number of histogram bins
+        min_val: Smallest value in data
+        max_val: Largest value in data (must differ from min_val)
+
+    Returns:
+        List[int]: Number of values in each bin
+    """
+    bin_width = (max_val - min_val) / bins
+    last_bin = bins - 1
+    bin_counts = [0] * bins
+
+    # Count values in each bin
+    for value in data:
+        bin_index = int((value - min_val) / bin_width)
+        bin_counts[bin_index if bin_index < last_bin else last_bin] += 1
+
+    return bin_counts
+
+
+def create_histogram_from_bins(
+    bin_counts: List[int],
+    min_val: Union[int, float],
+    max_val: Union[int, float],
     title: str = "",
     width: Optional[int] = None,
     height: Optional[int] = None
 ) -> str:
     """
-    Create a histogram from numeric data.
+    Create a histogram from already binned counts.
 
     Args:
-        data: List of numeric values
-        bins: Number of histogram bins
+        bin_counts: Number of values in each equal-width bin
+        min_val: Start of the first bin
+        max_val: End of the last bin
         title: Chart title
         width: Chart width
         height: Chart height
@@ -206,31 +289,16 @@ def create_histogram(
     Returns:
         str: ASCII histogram
     """
-    if not data:
-        return muted("No data to display")
-
-    # Calculate histogram bins
-    min_val = min(data)
-    max_val = max(data)
-
-    if min_val == max_val:
-        # All values are the same
-        return create_bar_chart([(f"{min_val}", len(data))], title, width, height)
-
+    bins = len(bin_counts)
     bin_width = (max_val - min_val) / bins
-    bin_counts = [0] * bins
-    bin_labels = []
-
-    # Count values in each bin
-    for value in data:
-        bin_index = min(int((value - min_val) / bin_width), bins - 1)
-        bin_counts[bin_index] += 1
+    integer_labels = isinstance(min_val, int) and isinstance(max_val, int) and bin_width >= 1
 
     # Create bin labels
+    bin_labels = []
     for i in range(bins):
         bin_start = min_val + i * bin_width
         bin_end = min_val + (i + 1) * bin_width
-        if isinstance(min_val, int) and isinstance(max_val, int) and bin_width >= 1:
+        if integer_labels:
             label = f"{int(bin_start)}-{int(bin_end)}"
         else:
             label = f"{bin_start:.1f}-{bin_end:.1f}"
@@ -242,6 +310,46 @@ def create_histogram(
     return create_bar_chart(chart_data, title, width, height, color=Colors.GREEN)
 
 
+def create_histogram(
+    data: List[Union[int, float]],
+    bins: int = 10,
+    title: str = "",
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    value_range: Optional[Tuple[Union[int, float], Union[int, float]]] = None
+) -> str:
+    """
+    Create a histogram from numeric data.
+
+    Args:
+        data: List of numeric values
+        bins: Number of histogram bins
+        title: Chart title
+        width: Chart width
+        height: Chart height
+        value_range: (min, max) of data if the caller already has it,
+            which saves scanning the data for it
+
+    Returns:
+        str: ASCII histogram
+    """
+    if not data:
+        return muted("No data to display")
+
+    # Calculate histogram bins
+    if value_range is None:
+        min_val, max_val = _minmax(data)
+    else:
+        min_val, max_val = value_range
+
+    if min_val == max_val:
+        # All values are the same
+        return create_bar_chart([(f"{min_val}", len(data))], title, width, height)
+
+    bin_counts = histogram_bins(data, bins, min_val, max_val)
+    return create_histogram_from_bins(bin_counts, min_val, max_val, title, width, height)
+
+
 def create_line_chart(
     data: List[Tuple[str, Union[int, float]]],
     title: str = "",
@@ -280,8 +388,7 @@ def create_line_chart(
     if not values:
         return muted("No data to display")
 
-    min_val = min(values)
-    max_val = max(values)
+    min_val, max_val = _minmax(values)
 
     lines = []
 
@@ -296,12 +403,17 @@ def create_line_chart(
 
     # Normalize values to chart height
     if max_val == min_val:
-        normalized_values = [chart_height // 2] * len(values)
+        normalized_values = (chart_height // 2,) * len(values)
     else:
-        normalized_values = [
+        normalized_values = tuple(
             int(((value - min_val) / (max_val - min_val)) * (chart_height - 1))
             for value in values
-        ]
+        )
+
+    # Point and connector cells are the same for every row, so colorize
+    # them once rather than per cell
+    dot = colorize("●", Colors.CYAN)
+    bar = colorize("│", Colors.CYAN)
 
     # Create the chart line by line (top to bottom)
     for row in range(chart_height - 1, -1, -1):
@@ -324,22 +436,19 @@ def create_line_chart(
         # Chart content
         for i, norm_val in enumerate(normalized_values):
             if norm_val == row:
-                line_chars.append(colorize("●", Colors.CYAN))
+                line_chars.append(dot)
             elif i > 0 and (
                 (normalized_values[i-1] < row < norm_val) or
                 (norm_val < row < normalized_values[i-1])
             ):
-                line_chars.append(colorize("│", Colors.CYAN))
+                line_chars.append(bar)
             else:
                 line_chars.append(" ")
 
         lines.append("".join(line_chars))
 
-    # Add x-axis
-    x_axis = " " * 8
-    for i, label in enumerate(labels):
-        if i < chart_width:
-            x_axis += label[0] if label else " "
+    # Add x-axis: the first letter of each label that fits the chart width
+    x_axis = " " * 8 + "".join(label[0] if label else " " for label in labels[:chart_width])
     lines.append(muted(x_axis))
 
     return "\n".join(lines)
@@ -360,18 +469,7 @@ def create_time_pattern_chart(
         str: ASCII time pattern chart
     """
     # Create data for all 24 hours
-    chart_data = []
-    for hour in range(24):
-        count = hourly_data.get(hour, 0)
-        if hour == 0:
-            label = "12AM"
-        elif hour < 12:
-            label = f"{hour}AM"
-        elif hour == 12:
-            label = "12PM"
-        else:
-            label = f"{hour-12}PM"
-        chart_data.append((label, count))
+    chart_data = [(label, hourly_data.get(hour, 0)) for hour, label in enumerate(_HOUR_LABELS)]
 
     return create_bar_chart(chart_data, title, color=Colors.MAGENTA)
 
@@ -390,12 +488,7 @@ def create_day_pattern_chart(
     Returns:
         str: ASCII day pattern chart
     """
-    days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    chart_data = []
-
-    for i, day in enumerate(days):
-        count = daily_data.get(i, 0)
-        chart_data.append((day, count))
+    chart_data = [(day, daily_data.get(i, 0)) for i, day in enumerate(_DAY_LABELS)]
 
     return create_bar_chart(chart_data, title, color=Colors.YELLOW)
 
@@ -413,38 +506,46 @@ def create_summary_box(stats: Dict[str, Any], title: str = "Meeting Statistics")
     """
     lines = []
 
-    # Calculate box width (add 1 extra space to ensure proper right padding)
-    max_width = max(len(str(v)) + len(k) + 5 for k, v in stats.items())
+    # Render each value once, sizing the box from the rendered strings
+    # (add 1 extra space to ensure proper right padding)
+    rendered = []
+    max_width = 0
+    for key, value in stats.items():
+        value_str = f"{value:.1f}" if isinstance(value, float) else str(value)
+        rendered.append((key, value_str))
+        row_width = len(key) + len(value_str) + 5
+        if row_width > max_width:
+            max_width = row_width
     box_width = max(max_width, len(title) + 4, 30)
 
+    # Border run shared by the top, separator and bottom lines, and the
+    # side border bound once for the per-statistic lines
+    horizontal = ChartConfig.HORIZONTAL * (box_width - 2)
+    vertical = ChartConfig.VERTICAL
+
     # Top border
-    lines.append(ChartConfig.TOP_LEFT + ChartConfig.HORIZONTAL * (box_width - 2) + ChartConfig.TOP_RIGHT)
+    lines.append(f"{ChartConfig.TOP_LEFT}{horizontal}{ChartConfig.TOP_RIGHT}")
 
     # Title
     title_padding = (box_width - len(title) - 2) // 2
-    title_line = ChartConfig.VERTICAL + " " * title_padding + header(title) + " " * (box_width - len(title) - title_padding - 2) + ChartConfig.VERTICAL
-    lines.append(title_line)
+    title_trailing = box_width - len(title) - title_padding - 2
+    lines.append(
+        f"{vertical}{' ' * title_padding}{header(title)}{' ' * title_trailing}{vertical}"
+    )
 
     # Separator
-    lines.append(ChartConfig.T_RIGHT + ChartConfig.HORIZONTAL * (box_width - 2) + ChartConfig.T_LEFT)
+    lines.append(f"{ChartConfig.T_RIGHT}{horizontal}{ChartConfig.T_LEFT}")
 
     # Statistics
-    for key, value in stats.items():
-        if isinstance(value, float):
-            value_str = f"{value:.1f}"
-        else:
-            value_str = str(value)
-
-        colored_value = colorize(value_str, Colors.BRIGHT_CYAN)
-        content = f"{key}: {colored_value}"
-        # Calculate padding using original value_str length (without color codes)
-        padding = box_width - len(key) - len(value_str) - 5
-        # Ensure minimum padding of 1 space before right border
-        padding = max(padding, 1)
-        line = ChartConfig.VERTICAL + f" {content}" + " " * padding + ChartConfig.VERTICAL
-        lines.append(line)
+    for key, value_str in rendered:
+        # Pad using the uncolored value length, with at least one space
+        # before the right border
+        padding = max(box_width - len(key) - len(value_str) - 5, 1)
+        lines.append(
+            f"{vertical} {key}: {colorize(value_str, Colors.BRIGHT_CYAN)}{' ' * padding}{vertical}"
+        )
 
     # Bottom border
-    lines.append(ChartConfig.BOTTOM_LEFT + ChartConfig.HORIZONTAL * (box_width - 2) + ChartConfig.BOTTOM_RIGHT)
+    lines.append(f"{ChartConfig.BOTTOM_LEFT}{horizontal}{ChartConfig.BOTTOM_RIGHT}")
 
     return "\n".join(lines)
\ No newline at end of file
@@ -8,6 +8,10 @@ using only Python standard library.
 import sys
 from typing import Optional
 
+# Mirrors Colors._enabled so colorize() reads a global instead of calling
+# a classmethod on every call
+_colors_enabled = True
+
 
 class Colors:
     """ANSI color codes and formatting constants."""
@@ -70,12 +74,14 @@ class Colors:
     @classmethod
     def disable(cls) -> None:
         """Disable all color output."""
-        cls._enabled = False
+        global _colors_enabled
+        cls._enabled = _colors_enabled = False
 
     @classmethod
     def enable(cls) -> None:
         """Enable color output."""
-        cls._enabled = True
+        global _colors_enabled
+        cls._enabled = _colors_enabled = True
 
     @classmethod
     def is_enabled(cls) -> bool:
@@ -95,7 +101,7 @@ def colorize(text: str, color: str, reset: bool = True) -> str:
     Returns:
         str: Colorized text (or plain text if colors disabled)
     """
-    if not Colors.is_enabled():
+    if not _colors_enabled:
         return text
 
     if reset:
@@ -204,41 +210,33 @@ def print_subheader(text: str, file=None) -> None:
     print_colored(text, Colors.SUBHEADER, file)
 
 
-def format_duration(seconds: Optional[float]) -> str:
+def format_duration(seconds: Optional[float], plain: bool = False) -> str:
     """
     Format duration in seconds to human-readable format.
 
     Args:
         seconds: Duration in seconds
+        plain: If True, never add color codes (for markdown or other
+            non-terminal output)
 
     Returns:
         str: Formatted duration (e.g., "1h 23m", "45m 30s", "2m 15s")
     """
     if seconds is None:
-        return muted("Unknown")
+        return "Unknown" if plain else muted("Unknown")
 
     if seconds < 0:
-        return muted("Invalid")
+        return "Invalid" if plain else muted("Invalid")
 
     # Convert to integer seconds for display
-    total_seconds = int(seconds)
-
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    secs = total_seconds % 60
-
-    if hours > 0:
-        if minutes > 0:
-            return f"{hours}h {minutes}m"
-        else:
-            return f"{hours}h"
-    elif minutes > 0:
-        if secs > 0:
-            return f"{minutes}m {secs}s"
-        else:
-            return f"{minutes}m"
-    else:
-        return f"{secs}s"
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+
+    if hours:
+        return f"{hours}h {minutes}m" if minutes else f"{hours}h"
+    if minutes:
+        return f"{minutes}m {secs}s" if secs else f"{minutes}m"
+    return f"{secs}s"
 
 
 def format_participant_count(count: int) -> str:
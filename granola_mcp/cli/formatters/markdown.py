@@ -6,11 +6,19 @@ suitable for documentation and sharing.
 """
 
 import datetime
+from itertools import groupby
+from operator import itemgetter
 from typing import List, Optional, Dict, Any
 from ..formatters.colors import format_duration
 from ...core.meeting import Meeting
 from ...core.transcript import TranscriptSegment
 
+# Markdown special characters, each mapped to its backslash-escaped form
+_MARKDOWN_ESCAPES = str.maketrans({
+    char: f'\\{char}'
+    for char in ['\\', '`', '*', '_', '{', '}', '[', ']', '(', ')', '#', '+', '-', '.', '!']
+})
+
 
 def escape_markdown(text: str) -> str:
     """
@@ -25,25 +33,19 @@ def escape_markdown(text: str) -> str:
     if not text:
         return ""
 
-    # Escape markdown special characters
-    special_chars = ['\\', '`', '*', '_', '{', '}', '[', ']', '(', ')', '#', '+', '-', '.', '!']
-    escaped_text = text
-
-    for char in special_chars:
-        escaped_text = escaped_text.replace(char, f'\\{char}')
-
-    return escaped_text
+    # Escape markdown special characters in a single pass
+    return text.translate(_MARKDOWN_ESCAPES)
 
 
-def format_meeting_header(meeting: Meeting) -> str:
+def _format_meeting_header_lines(meeting: Meeting) -> List[str]:
     """
-    Format meeting header in markdown.
+    Build the lines of the meeting header in markdown.
 
     Args:
         meeting: Meeting object
 
     Returns:
-        str: Formatted markdown header
+        List[str]: Lines of the formatted markdown header
     """
     lines = []
 
@@ -52,18 +54,31 @@ def format_meeting_header(meeting: Meeting) -> str:
     lines.append(f"# {escape_markdown(title)}")
     lines.append("")
 
-    return "\n".join(lines)
+    return lines
 
 
-def format_meeting_metadata(meeting: Meeting) -> str:
+def format_meeting_header(meeting: Meeting) -> str:
     """
-    Format meeting metadata in markdown.
+    Format meeting header in markdown.
 
     Args:
         meeting: Meeting object
 
     Returns:
-        str: Formatted markdown metadata
+        str: Formatted markdown header
+    """
+    return "\n".join(_format_meeting_header_lines(meeting))
+
+
+def _format_meeting_metadata_lines(meeting: Meeting) -> List[str]:
+    """
+    Build the lines of the meeting metadata in markdown.
+
+    Args:
+        meeting: Meeting object
+
+    Returns:
+        List[str]: Lines of the formatted markdown metadata
     """
     lines = []
     lines.append("## Meeting Information")
@@ -79,11 +94,8 @@ def format_meeting_metadata(meeting: Meeting) -> str:
         metadata_items.append(("Date & Time", meeting.start_time.strftime("%Y-%m-%d %H:%M:%S %Z")))
 
     if meeting.duration:
-        duration_str = format_duration(meeting.duration.total_seconds())
-        # Remove ANSI codes for markdown
-        import re
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        duration_str = ansi_escape.sub('', duration_str)
+        # Plain formatting keeps ANSI codes out of the markdown
+        duration_str = format_duration(meeting.duration.total_seconds(), plain=True)
         metadata_items.append(("Duration", duration_str))
 
     participants = meeting.participants
@@ -98,22 +110,35 @@ def format_meeting_metadata(meeting: Meeting) -> str:
             lines.append(f"| {key} | {value} |")
         lines.append("")
 
-    return "\n".join(lines)
+    return lines
 
 
-def format_participants_section(meeting: Meeting) -> str:
+def format_meeting_metadata(meeting: Meeting) -> str:
     """
-    Format participants section in markdown.
+    Format meeting metadata in markdown.
 
     Args:
         meeting: Meeting object
 
     Returns:
-        str: Formatted markdown participants section
+        str: Formatted markdown metadata
+    """
+    return "\n".join(_format_meeting_metadata_lines(meeting))
+
+
+def _format_participants_section_lines(meeting: Meeting) -> List[str]:
+    """
+    Build the lines of the participants section in markdown.
+
+    Args:
+        meeting: Meeting object
+
+    Returns:
+        List[str]: Lines of the formatted markdown participants section
     """
     participants = meeting.participants
     if not participants:
-        return ""
+        return []
 
     lines = []
     lines.append("## Participants")
@@ -123,22 +148,35 @@ def format_participants_section(meeting: Meeting) -> str:
         lines.append(f"- {escape_markdown(participant)}")
 
     lines.append("")
-    return "\n".join(lines)
+    return lines
 
 
-def format_summary_section(meeting: Meeting) -> str:
+def format_participants_section(meeting: Meeting) -> str:
     """
-    Format AI summary section in markdown.
+    Format participants section in markdown.
 
     Args:
         meeting: Meeting object
 
     Returns:
-        str: Formatted markdown AI summary section
+        str: Formatted markdown participants section
+    """
+    return "\n".join(_format_participants_section_lines(meeting))
+
+
+def _format_summary_section_lines(meeting: Meeting) -> List[str]:
+    """
+    Build the lines of the AI summary section in markdown.
+
+    Args:
+        meeting: Meeting object
+
+    Returns:
+        List[str]: Lines of the formatted markdown AI summary section
     """
     summary = meeting.summary
     if not summary:
-        return ""
+        return []
 
     lines = []
     lines.append("## AI Summary")
@@ -146,22 +184,35 @@ def format_summary_section(meeting: Meeting) -> str:
     lines.append(escape_markdown(summary))
     lines.append("")
 
-    return "\n".join(lines)
+    return lines
 
 
-def format_notes_section(meeting: Meeting) -> str:
+def format_summary_section(meeting: Meeting) -> str:
     """
-    Format human notes section in markdown.
+    Format AI summary section in markdown.
 
     Args:
         meeting: Meeting object
 
     Returns:
-        str: Formatted markdown human notes section
+        str: Formatted markdown AI summary section
+    """
+    return "\n".join(_format_summary_section_lines(meeting))
+
+
+def _format_notes_section_lines(meeting: Meeting) -> List[str]:
+    """
+    Build the lines of the human notes section in markdown.
+
+    Args:
+        meeting: Meeting object
+
+    Returns:
+        List[str]: Lines of the formatted markdown human notes section
     """
     notes = meeting.human_notes
     if not notes:
-        return ""
+        return []
 
     lines = []
     lines.append("## Human Notes")
@@ -169,13 +220,26 @@ def format_notes_section(meeting: Meeting) -> str:
     lines.append(escape_markdown(notes))
     lines.append("")
 
-    return "\n".join(lines)
+    return lines
 
 
-def format_transcript_section(meeting: Meeting, include_speakers: bool = True,
-                            include_timestamps: bool = False) -> str:
+def format_notes_section(meeting: Meeting) -> str:
     """
-    Format transcript section in markdown.
+    Format human notes section in markdown.
+
+    Args:
+        meeting: Meeting object
+
+    Returns:
+        str: Formatted markdown human notes section
+    """
+    return "\n".join(_format_notes_section_lines(meeting))
+
+
+def _format_transcript_section_lines(meeting: Meeting, include_speakers: bool = True,
+                                   include_timestamps: bool = False) -> List[str]:
+    """
+    Build the lines of the transcript section in markdown.
 
     Args:
         meeting: Meeting object
@@ -183,11 +247,11 @@ def format_transcript_section(meeting: Meeting, include_speakers: bool = True,
         include_timestamps: Whether to include timestamps
 
     Returns:
-        str: Formatted markdown transcript section
+        List[str]: Lines of the formatted markdown transcript section
     """
     transcript = meeting.transcript
     if not transcript:
-        return ""
+        return []
 
     lines = []
     lines.append("## Transcript")
@@ -200,55 +264,74 @@ def format_transcript_section(meeting: Meeting, include_speakers: bool = True,
         lines.append(escape_markdown(transcript.full_text))
         lines.append("```")
     else:
-        # Format segments
+        # Format segments in runs of consecutive segments by the same
+        # speaker, so each speaker label is built and escaped once per run
         current_speaker = None
-
+        spoken = []
         for segment in segments:
-            speaker = segment.speaker
             text = segment.text.strip()
+            if text:
+                spoken.append((segment.speaker, text, segment))
 
-            if not text:
-                continue
-
-            # Add speaker header if changed and speakers are included
-            if include_speakers and speaker and speaker != current_speaker:
-                if current_speaker is not None:
-                    lines.append("")  # Add spacing between speakers
-                lines.append(f"**{escape_markdown(speaker)}:**")
+        for speaker, run in groupby(spoken, key=itemgetter(0)):
+            if include_speakers and speaker:
+                # Add speaker header if changed
+                if speaker != current_speaker:
+                    if current_speaker is not None:
+                        lines.append("")  # Add spacing between speakers
+                    lines.append(f"**{escape_markdown(speaker)}:**")
+                    lines.append("")
+                    current_speaker = speaker
+                speaker_label = ""
+            else:
+                speaker_label = f"**{escape_markdown(speaker or 'Unknown')}:** "
+
+            for _, text, segment in run:
+                # Add timestamp if requested
+                timestamp_prefix = ""
+                if include_timestamps:
+                    start_time = segment.start_time
+                    if start_time is not None:
+                        minutes = int(start_time // 60)
+                        seconds = int(start_time % 60)
+                        timestamp_prefix = f"*[{minutes:02d}:{seconds:02d}]* "
+
+                # Add the text
+                lines.append(f"{timestamp_prefix}{speaker_label}{escape_markdown(text)}")
                 lines.append("")
-                current_speaker = speaker
 
-            # Add timestamp if requested
-            timestamp_prefix = ""
-            if include_timestamps and segment.start_time is not None:
-                minutes = int(segment.start_time // 60)
-                seconds = int(segment.start_time % 60)
-                timestamp_prefix = f"*[{minutes:02d}:{seconds:02d}]* "
+    return lines
 
-            # Add the text
-            if include_speakers and speaker:
-                lines.append(f"{timestamp_prefix}{escape_markdown(text)}")
-            else:
-                lines.append(f"{timestamp_prefix}**{escape_markdown(speaker or 'Unknown')}:** {escape_markdown(text)}")
 
-            lines.append("")
+def format_transcript_section(meeting: Meeting, include_speakers: bool = True,
+                            include_timestamps: bool = False) -> str:
+    """
+    Format transcript section in markdown.
 
-    return "\n".join(lines)
+    Args:
+        meeting: Meeting object
+        include_speakers: Whether to include speaker names
+        include_timestamps: Whether to include timestamps
+
+    Returns:
+        str: Formatted markdown transcript section
+    """
+    return "\n".join(_format_transcript_section_lines(meeting, include_speakers, include_timestamps))
 
 
-def format_tags_section(meeting: Meeting) -> str:
+def _format_tags_section_lines(meeting: Meeting) -> List[str]:
     """
-    Format tags section in markdown.
+    Build the lines of the tags section in markdown.
 
     Args:
         meeting: Meeting object
 
     Returns:
-        str: Formatted markdown tags section
+        List[str]: Lines of the formatted markdown tags section
     """
     tags = meeting.tags
     if not tags:
-        return ""
+        return []
 
     lines = []
     lines.append("## Tags")
@@ -258,7 +341,20 @@ def format_tags_section(meeting: Meeting) -> str:
     lines.append(" ".join(tag_items))
     lines.append("")
 
-    return "\n".join(lines)
+    return lines
+
+
+def format_tags_section(meeting: Meeting) -> str:
+    """
+    Format tags section in markdown.
+
+    Args:
+        meeting: Meeting object
+
+    Returns:
+        str: Formatted markdown tags section
+    """
+    return "\n".join(_format_tags_section_lines(meeting))
 
 
 def export_meeting_to_markdown(meeting: Meeting, include_transcript: bool = True,
@@ -283,54 +379,42 @@ def export_meeting_to_markdown(meeting: Meeting, include_transcript: bool = True
     Returns:
         str: Complete markdown document
     """
-    sections = []
-
-    # Header
-    sections.append(format_meeting_header(meeting))
+    # Every section adds its lines to one list that is joined once; a
+    # section with content always starts with its heading, and an empty
+    # section has no lines, so nothing blank is added
+    lines = _format_meeting_header_lines(meeting)
 
     # Metadata
     if include_metadata:
-        metadata_section = format_meeting_metadata(meeting)
-        if metadata_section.strip():
-            sections.append(metadata_section)
+        lines.extend(_format_meeting_metadata_lines(meeting))
 
     # Participants
     if include_participants:
-        participants_section = format_participants_section(meeting)
-        if participants_section.strip():
-            sections.append(participants_section)
+        lines.extend(_format_participants_section_lines(meeting))
 
     # Human Notes
     if include_notes:
-        notes_section = format_notes_section(meeting)
-        if notes_section.strip():
-            sections.append(notes_section)
+        lines.extend(_format_notes_section_lines(meeting))
 
     # AI Summary
     if include_summary:
-        summary_section = format_summary_section(meeting)
-        if summary_section.strip():
-            sections.append(summary_section)
+        lines.extend(_format_summary_section_lines(meeting))
 
     # Tags
     if include_tags:
-        tags_section = format_tags_section(meeting)
-        if tags_section.strip():
-            sections.append(tags_section)
+        lines.extend(_format_tags_section_lines(meeting))
 
     # Transcript
     if include_transcript:
-        transcript_section = format_transcript_section(
+        lines.extend(_format_transcript_section_lines(
             meeting, include_speakers, include_timestamps
-        )
-        if transcript_section.strip():
-            sections.append(transcript_section)
+        ))
 
     # Add footer
-    sections.append("---")
-    sections.append(f"*Exported on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
+    lines.append("---")
+    lines.append(f"*Exported on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
 
-    return "\n".join(sections)
+    return "\n".join(lines)
 
 
 def create_meeting_summary_table(meetings: List[Meeting]) -> str:
@@ -359,11 +443,7 @@ def create_meeting_summary_table(meetings: List[Meeting]) -> str:
 
         duration_str = "Unknown"
         if meeting.duration:
-            duration_str = format_duration(meeting.duration.total_seconds())
-            # Remove ANSI codes
-            import re
-            ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-            duration_str = ansi_escape.sub('', duration_str)
+            duration_str = format_duration(meeting.duration.total_seconds(), plain=True)
 
         participant_count = len(meeting.participants)
 
@@ -5,7 +5,7 @@ Provides functions for creating formatted tables with borders, alignment,
 and color support using only Python standard library.
 """
 
-from typing import List, Dict, Any, Optional, Union
+from typing import Iterable, List, Dict, Any, Optional, Sequence, Union
 from .colors import Colors, colorize
 
 
@@ -47,20 +47,34 @@ class Table:
         Args:
             row: List of cell values
         """
-        if len(row) != len(self.headers):
-            raise ValueError(f"Row must have {len(self.headers)} columns, got {len(row)}")
+        self.extend_rows((row,))
 
-        # Convert all values to strings and update column widths
-        str_row = []
-        for i, cell in enumerate(row):
-            cell_str = str(cell) if cell is not None else ""
-            str_row.append(cell_str)
+    def extend_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """
+        Add multiple rows to the table.
 
-            # Update column width (accounting for ANSI codes)
-            display_width = self._get_display_width(cell_str)
-            self.column_widths[i] = max(self.column_widths[i], display_width)
+        Equivalent to calling add_row() for each row, without the per-row
+        method call overhead.
 
-        self.rows.append(str_row)
+        Args:
+            rows: Iterable of rows, each a sequence of cell values
+        """
+        column_count = len(self.headers)
+        column_widths = self.column_widths
+        get_display_width = self._get_display_width
+        append_row = self.rows.append
+
+        for row in rows:
+            if len(row) != column_count:
+                raise ValueError(f"Row must have {column_count} columns, got {len(row)}")
+
+            str_row = [str(cell) if cell is not None else "" for cell in row]
+            for i, cell_str in enumerate(str_row):
+                display_width = get_display_width(cell_str)
+                if display_width > column_widths[i]:
+                    column_widths[i] = display_width
+
+            append_row(str_row)
 
     def _get_display_width(self, text: str) -> int:
         """
@@ -6,22 +6,103 @@ Granola.ai meeting objects.
 """
 
 import datetime
-from typing import Dict, Any, List, Optional
-from .timezone_utils import convert_utc_to_cst
+from collections import ChainMap
+from functools import cached_property
+from typing import Dict, Any, List, Mapping, Optional
+from .timezone_utils import convert_utc_to_cst, get_cst_timezone, parse_utc_timestamp
 from .transcript import Transcript
 
 
+# Fields that may hold a meeting's ID, in priority order
+MEETING_ID_FIELDS = ('id', 'meeting_id', 'session_id', 'uuid')
+
+# Fields that may hold a meeting's title, in priority order
+TITLE_FIELDS = ('title', 'name', 'subject', 'meeting_name', 'summary')
+
+# Fields that may hold a meeting's start time, in priority order
+START_TIME_FIELDS = ('start_time', 'startTime', 'created_at', 'timestamp', 'date')
+
+
+def get_meeting_id(meeting_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the ID from raw meeting data without constructing a Meeting.
+
+    Args:
+        meeting_data: Raw meeting data dictionary from cache
+
+    Returns:
+        Optional[str]: Meeting ID or None if not present
+    """
+    for id_field in MEETING_ID_FIELDS:
+        if id_field in meeting_data:
+            return str(meeting_data[id_field])
+    return None
+
+
+def get_meeting_title(meeting_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the title from raw meeting data without constructing a Meeting.
+
+    Args:
+        meeting_data: Raw meeting data dictionary from cache
+
+    Returns:
+        Optional[str]: Meeting title or None if not present
+    """
+    for title_field in TITLE_FIELDS:
+        if title_field in meeting_data:
+            return str(meeting_data[title_field])
+    return None
+
+
+def get_meeting_start_time_utc(meeting_data: Dict[str, Any]) -> Optional[datetime.datetime]:
+    """
+    Get the start time from raw meeting data as an aware UTC datetime.
+
+    Skips the CST conversion so callers can range-check raw records cheaply
+    before wrapping them in a Meeting. Aware datetimes compare correctly
+    across timezones, so the result can be compared to CST bounds directly.
+
+    Args:
+        meeting_data: Raw meeting data dictionary from cache
+
+    Returns:
+        Optional[datetime.datetime]: Start time in UTC or None if not found
+    """
+    # Try different possible start time fields
+    for time_field in START_TIME_FIELDS:
+        if time_field in meeting_data:
+            try:
+                return parse_utc_timestamp(meeting_data[time_field])
+            except (ValueError, TypeError):
+                continue
+
+    # Handle Google Calendar format: start.dateTime
+    start_data = meeting_data.get('start')
+    if isinstance(start_data, dict) and 'dateTime' in start_data:
+        try:
+            return parse_utc_timestamp(start_data['dateTime'])
+        except (ValueError, TypeError):
+            pass
+
+    return None
+
+
 class Meeting:
     """
     Represents a single Granola.ai meeting with its metadata and content.
+
+    Start/end times, duration and participants are parsed on first access and
+    cached on the instance, so the underlying data should not be modified
+    after construction.
     """
 
-    def __init__(self, meeting_data: Dict[str, Any]):
+    def __init__(self, meeting_data: Mapping[str, Any]):
         """
         Initialize a Meeting object from raw meeting data.
 
         Args:
-            meeting_data: Raw meeting data dictionary from cache
+            meeting_data: Raw meeting data mapping from cache
         """
         self._data = meeting_data
         self._transcript: Optional[Transcript] = None
@@ -29,44 +110,22 @@ class Meeting:
     @property
     def id(self) -> Optional[str]:
         """Get the meeting ID."""
-        # Try different possible ID fields
-        for id_field in ['id', 'meeting_id', 'session_id', 'uuid']:
-            if id_field in self._data:
-                return str(self._data[id_field])
-        return None
+        return get_meeting_id(self._data)
 
     @property
     def title(self) -> Optional[str]:
         """Get the meeting title."""
-        # Try different possible title fields
-        for title_field in ['title', 'name', 'subject', 'meeting_name', 'summary']:
-            if title_field in self._data:
-                return str(self._data[title_field])
-        return None
+        return get_meeting_title(self._data)
 
-    @property
+    @cached_property
     def start_time(self) -> Optional[datetime.datetime]:
         """Get the meeting start time in CST."""
-        # Try different possible start time fields
-        for time_field in ['start_time', 'startTime', 'created_at', 'timestamp', 'date']:
-            if time_field in self._data:
-                try:
-                    return convert_utc_to_cst(self._data[time_field])
-                except (ValueError, TypeError):
-                    continue
-
-        # Handle Google Calendar format: start.dateTime
-        if 'start' in self._data and isinstance(self._data['start'], dict):
-            start_data = self._data['start']
-            if 'dateTime' in start_data:
-                try:
-                    return convert_utc_to_cst(start_data['dateTime'])
-                except (ValueError, TypeError):
-                    pass
-
-        return None
+        start_time = get_meeting_start_time_utc(self._data)
+        if start_time is None:
+            return None
+        return start_time.astimezone(get_cst_timezone())
 
-    @property
+    @cached_property
     def end_time(self) -> Optional[datetime.datetime]:
         """Get the meeting end time in CST."""
         # Try different possible end time fields
@@ -88,7 +147,7 @@ class Meeting:
 
         return None
 
-    @property
+    @cached_property
     def duration(self) -> Optional[datetime.timedelta]:
         """
         Get the meeting duration with improved calculation logic.
@@ -224,7 +283,7 @@ class Meeting:
             except:
                 return None
 
-    @property
+    @cached_property
     def participants(self) -> List[str]:
         """Get the list of meeting participants."""
         participants = []
@@ -395,7 +454,21 @@ class Meeting:
     @property
     def raw_data(self) -> Dict[str, Any]:
         """Get the raw meeting data."""
-        return self._data.copy()
+        return dict(self._data)
+
+    def with_overrides(self, **fields: Any) -> 'Meeting':
+        """
+        Create a Meeting that sees the given fields in place of the originals.
+
+        The original data is layered underneath rather than copied.
+
+        Args:
+            **fields: Field values to override
+
+        Returns:
+            Meeting: New meeting with the overrides applied
+        """
+        return Meeting(ChainMap(fields, self._data))
 
     def get_field(self, field_name: str, default: Any = None) -> Any:
         """
@@ -5,10 +5,46 @@ Provides the GranolaParser class for loading and parsing Granola.ai cache files
 with double JSON parsing and proper error handling.
 """
 
+import bisect
 import json
+import mmap
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from ..utils.config import get_cache_path, validate_cache_path
+from .meeting import get_meeting_id
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+
+def _loads_json(data: Any) -> Any:
+    """
+    Parse JSON from a str, bytes, or read-only memory map.
+
+    With orjson installed, integers wider than 64 bits are parsed as floats
+    rather than exact ints; the stdlib fallback keeps them exact.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Any: Parsed value
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        if isinstance(data, mmap.mmap):
+            with memoryview(data) as view:
+                return orjson.loads(view)
+        return orjson.loads(data)
+
+    if isinstance(data, mmap.mmap):
+        data = data[:]
+    return json.loads(data)
 
 
 class GranolaParseError(Exception):
@@ -34,7 +70,8 @@ class GranolaParser:
         """
         self.cache_path = cache_path or get_cache_path()
         self._cache_data: Optional[Dict[str, Any]] = None
-        self._raw_data: Optional[str] = None
+        # Sorted (ids, meetings) for prefix lookups, built on first use
+        self._id_index: Optional[Tuple[List[str], List[Dict[str, Any]]]] = None
 
     def load_cache(self, force_reload: bool = False) -> Dict[str, Any]:
         """
@@ -56,16 +93,21 @@ class GranolaParser:
         if not validate_cache_path(self.cache_path):
             raise GranolaParseError(f"Cache file not found or not readable: {self.cache_path}")
 
-        try:
-            # Read the raw file content
-            with open(self.cache_path, 'r', encoding='utf-8') as f:
-                self._raw_data = f.read()
+        self._id_index = None
 
-            # First JSON parse - get the outer structure
-            try:
-                outer_data = json.loads(self._raw_data)
-            except json.JSONDecodeError as e:
-                raise GranolaParseError(f"Invalid JSON in cache file: {e}") from e
+        try:
+            # First JSON parse - get the outer structure straight from a
+            # read-only mapping of the file so no text copy is kept around
+            with open(self.cache_path, 'rb') as f:
+                try:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        # Empty files cannot be mapped
+                        outer_data = _loads_json(b'')
+                    else:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                            outer_data = _loads_json(mapped)
+                except json.JSONDecodeError as e:
+                    raise GranolaParseError(f"Invalid JSON in cache file: {e}") from e
 
             # Validate outer structure has 'cache' field
             if not isinstance(outer_data, dict):
@@ -80,7 +122,7 @@ class GranolaParser:
 
             # Second JSON parse - parse the inner cache content
             try:
-                self._cache_data = json.loads(cache_content)
+                self._cache_data = _loads_json(cache_content)
             except json.JSONDecodeError as e:
                 raise GranolaParseError(f"Invalid JSON in cache content: {e}") from e
 
@@ -236,6 +278,36 @@ class GranolaParser:
 
         return None
 
+    def find_meeting_by_id_prefix(self, prefix: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a meeting whose ID starts with the given prefix.
+
+        Uses a sorted ID index built once per cache load, so repeated partial
+        lookups cost a binary search instead of a scan over every meeting.
+
+        Args:
+            prefix: Leading part of the meeting ID
+
+        Returns:
+            Optional[Dict[str, Any]]: Meeting object with the smallest matching ID,
+            or None if no ID starts with the prefix
+        """
+        if self._id_index is None:
+            entries = []
+            for meeting in self.get_meetings():
+                meeting_id = get_meeting_id(meeting)
+                if meeting_id:
+                    entries.append((meeting_id, meeting))
+            entries.sort(key=lambda entry: entry[0])
+            self._id_index = ([entry[0] for entry in entries], [entry[1] for entry in entries])
+
+        ids, meetings = self._id_index
+        index = bisect.bisect_left(ids, prefix)
+        if index < len(ids) and ids[index].startswith(prefix):
+            return meetings[index]
+
+        return None
+
     def validate_cache_structure(self) -> bool:
         """
         Validate that the cache has the expected structure.
@@ -20,30 +20,28 @@ def get_cst_timezone() -> ZoneInfo:
     return ZoneInfo("America/Chicago")
 
 
-def convert_utc_to_cst(utc_timestamp: Union[datetime.datetime, str, int, float]) -> datetime.datetime:
+def parse_utc_timestamp(utc_timestamp: Union[datetime.datetime, str, int, float]) -> datetime.datetime:
     """
-    Convert a UTC timestamp to CST.
+    Parse a UTC timestamp into a timezone-aware UTC datetime.
 
     Args:
         utc_timestamp: UTC timestamp as datetime object, ISO string, or Unix timestamp
 
     Returns:
-        datetime.datetime: Timestamp converted to CST
+        datetime.datetime: Timezone-aware datetime in UTC
 
     Raises:
         ValueError: If timestamp format is invalid
         TypeError: If timestamp type is not supported
     """
-    cst_tz = get_cst_timezone()
     utc_tz = ZoneInfo("UTC")
 
     # Handle different input types
     if isinstance(utc_timestamp, datetime.datetime):
         # If datetime has no timezone info, assume UTC
         if utc_timestamp.tzinfo is None:
-            utc_dt = utc_timestamp.replace(tzinfo=utc_tz)
-        else:
-            utc_dt = utc_timestamp.astimezone(utc_tz)
+            return utc_timestamp.replace(tzinfo=utc_tz)
+        return utc_timestamp.astimezone(utc_tz)
     elif isinstance(utc_timestamp, str):
         # Parse ISO format string
         try:
@@ -52,22 +50,35 @@ def convert_utc_to_cst(utc_timestamp: Union[datetime.datetime, str, int, float])
                 utc_timestamp = utc_timestamp[:-1] + '+00:00'
             utc_dt = datetime.datetime.fromisoformat(utc_timestamp)
             if utc_dt.tzinfo is None:
-                utc_dt = utc_dt.replace(tzinfo=utc_tz)
-            else:
-                utc_dt = utc_dt.astimezone(utc_tz)
+                return utc_dt.replace(tzinfo=utc_tz)
+            return utc_dt.astimezone(utc_tz)
         except ValueError as e:
             raise ValueError(f"Invalid ISO timestamp format: {utc_timestamp}") from e
     elif isinstance(utc_timestamp, (int, float)):
         # Unix timestamp
         try:
-            utc_dt = datetime.datetime.fromtimestamp(utc_timestamp, tz=utc_tz)
+            return datetime.datetime.fromtimestamp(utc_timestamp, tz=utc_tz)
         except (ValueError, OSError) as e:
             raise ValueError(f"Invalid Unix timestamp: {utc_timestamp}") from e
     else:
         raise TypeError(f"Unsupported timestamp type: {type(utc_timestamp)}")
 
-    # Convert to CST
-    return utc_dt.astimezone(cst_tz)
+
+def convert_utc_to_cst(utc_timestamp: Union[datetime.datetime, str, int, float]) -> datetime.datetime:
+    """
+    Convert a UTC timestamp to CST.
+
+    Args:
+        utc_timestamp: UTC timestamp as datetime object, ISO string, or Unix timestamp
+
+    Returns:
+        datetime.datetime: Timestamp converted to CST
+
+    Raises:
+        ValueError: If timestamp format is invalid
+        TypeError: If timestamp type is not supported
+    """
+    return parse_utc_timestamp(utc_timestamp).astimezone(get_cst_timezone())
 
 
 def format_cst_timestamp(cst_datetime: datetime.datetime, format_str: str = "%Y-%m-%d %H:%M:%S %Z") -> str:
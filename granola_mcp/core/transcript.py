@@ -213,7 +213,9 @@ class Transcript:
     @property
     def word_count(self) -> int:
         """Get the total word count of the transcript."""
-        return len(self.full_text.split())
+        # Count line by line so only one line's words are held in a list
+        # at a time; line breaks are whitespace, so no word spans two lines
+        return sum(map(len, map(str.split, self.full_text.splitlines())))
 
     @property
     def duration(self) -> Optional[float]:
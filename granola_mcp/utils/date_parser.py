@@ -6,6 +6,7 @@ Provides functions for parsing relative dates (3d, 24h, 1w) and absolute dates
 """
 
 import datetime
+import functools
 import re
 from typing import Union, Tuple, Optional
 from ..core.timezone_utils import get_cst_timezone
@@ -59,10 +60,13 @@ def parse_relative_date(relative_str: str, reference_time: Optional[datetime.dat
     return reference_time - delta
 
 
+@functools.lru_cache(maxsize=64)
 def parse_absolute_date(date_str: str, time_str: str = "00:00:00") -> datetime.datetime:
     """
     Parse an absolute date string like 'YYYY-MM-DD' into a datetime.
 
+    Results are cached since absolute dates do not depend on the current time.
+
     Args:
         date_str: Date string in YYYY-MM-DD format
         time_str: Time string in HH:MM:SS format (default: "00:00:00")
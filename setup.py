@@ -51,6 +51,10 @@ setup(
         # No external dependencies - using only Python standard library
     ],
     extras_require={
+        # Faster JSON; integers wider than 64 bits load as floats (see README)
+        "fast": [
+            "orjson>=3.9.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -0,0 +1,106 @@
+"""
+Tests for the collect command's daily file output.
+
+The daily files are streamed line by line; these tests pin the output to
+the whole-day join and strip the files were originally built with.
+"""
+
+import argparse
+import os
+
+import pytest
+
+from granola_mcp.cli.commands.collect import CollectCommand
+from granola_mcp.core.meeting import Meeting
+from granola_mcp.core.transcript import TranscriptSegment
+
+
+def make_meeting(title, texts):
+    """Build a meeting and its microphone segments from segment texts."""
+    meeting = Meeting({
+        'id': title,
+        'title': title,
+        'created_at': '2026-09-09T15:00:00Z',
+    })
+    segments = [TranscriptSegment({'text': text, 'source': 'microphone'}) for text in texts]
+    return meeting, segments
+
+
+def make_command(output_dir, include_meeting_info=False, include_timestamps=False):
+    """Build a collect command writing to output_dir."""
+    args = argparse.Namespace(
+        output_dir=str(output_dir),
+        include_meeting_info=include_meeting_info,
+        include_timestamps=include_timestamps,
+        verbose=False,
+    )
+    return CollectCommand(None, args)
+
+
+def expected_day(command, meeting_segments):
+    """Build a day's content the way collect originally did, in memory."""
+    all_content = []
+    for meeting, segments in meeting_segments:
+        content = '\n'.join(command._iter_segment_lines(meeting, segments))
+        if content.strip():
+            all_content.append(content)
+            all_content.append("")  # Add blank line between meetings
+
+    if not all_content:
+        return None
+    return '\n'.join(all_content).strip()
+
+
+DAYS = {
+    'whitespace_only_segments': [
+        make_meeting('Standup', ['  ', 'first words', ' \t', 'more words  ', '\n']),
+        make_meeting('Sync', ['', ' ']),
+        make_meeting('Review', ['  closing  words ', '   ']),
+    ],
+    'leading_blank_lines': [
+        make_meeting('Planning', ['', '   ', '\n', '  opening line', 'second line']),
+        make_meeting('Retro', [' ', '', 'only line']),
+    ],
+    'multiline_segments': [
+        make_meeting('1:1', ['\n  line one\n\nline two  \n', ' \n ']),
+        make_meeting('Ünïcode', ['héllo wörld', '  ']),
+    ],
+}
+
+
+@pytest.mark.parametrize('include_meeting_info', [False, True])
+@pytest.mark.parametrize('day', sorted(DAYS))
+def test_daily_file_matches_whole_day_strip(tmp_path, day, include_meeting_info):
+    command = make_command(tmp_path, include_meeting_info=include_meeting_info)
+    meeting_segments = DAYS[day]
+
+    word_count = command._write_daily_file('2026-09-09', meeting_segments)
+
+    expected = expected_day(command, meeting_segments)
+    with open(os.path.join(tmp_path, '2026-09-09.txt'), 'rb') as f:
+        assert f.read().decode('utf-8') == expected
+    assert word_count == len(expected.split())
+
+
+def test_meeting_info_without_segment_text(tmp_path):
+    command = make_command(tmp_path, include_meeting_info=True)
+    meeting_segments = [make_meeting('Silent', ['', '  ', '\n'])]
+
+    word_count = command._write_daily_file('2026-09-09', meeting_segments)
+
+    expected = expected_day(command, meeting_segments)
+    assert expected.startswith('# Meeting: Silent')
+    with open(os.path.join(tmp_path, '2026-09-09.txt'), 'rb') as f:
+        assert f.read().decode('utf-8') == expected
+    assert word_count == len(expected.split())
+
+
+def test_all_empty_day_creates_no_file(tmp_path):
+    command = make_command(tmp_path)
+    meeting_segments = [make_meeting('Quiet', ['', '  ']), make_meeting('Empty', ['\n'])]
+
+    word_count = command._write_daily_file('2026-09-09', meeting_segments)
+
+    assert expected_day(command, meeting_segments) is None
+    assert word_count == 0
+    assert not os.path.exists(os.path.join(tmp_path, '2026-09-09.txt'))